@@ -3,11 +3,63 @@ Shared utility functions for both Flask and FastAPI backends
 """
 
 import re
+import sys
+import time
 import uuid
+import bisect
 import hashlib
+import itertools
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-import json
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional
+import orjson
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional accelerator
+    xxhash = None
+
+# Common stop words excluded from keyword extraction (module-level so the
+# set is built once, not per call; interned so lookups can short-circuit
+# on string identity)
+STOP_WORDS = frozenset(sys.intern(word) for word in {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be',
+    'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'can', 'may', 'might', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it',
+    'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+# Precompiled word pattern (alphabetic, 3+ chars)
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Trending time-decay table: hours-since-published thresholds and the
+# decay factor for each bucket (last factor covers anything older)
+_TRENDING_HOUR_THRESHOLDS = (1, 24, 72, 168)
+_TRENDING_TIME_FACTORS = (1.0, 0.8, 0.6, 0.4, 0.1)
+
+# Character sets accepted in the local and domain parts of an email
+# (mirrors the former ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$ regex)
+_EMAIL_LOCAL_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-'
+)
+_EMAIL_DOMAIN_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-'
+)
+
+# Tags stripped by sanitize_html, combined into single alternations so
+# sanitization scans the content twice instead of twice per tag
+DANGEROUS_TAGS = ('script', 'iframe', 'object', 'embed', 'form', 'input')
+_PAIRED_TAG_RE = re.compile(
+    r'<(%s)\b[^>]*>.*?</\1>' % '|'.join(DANGEROUS_TAGS),
+    re.IGNORECASE | re.DOTALL
+)
+_VOID_TAG_RE = re.compile(
+    r'<(?:%s)\b[^>]*/?>' % '|'.join(DANGEROUS_TAGS),
+    re.IGNORECASE
+)
 
 
 def generate_uuid() -> str:
@@ -17,38 +69,30 @@ def generate_uuid() -> str:
 
 def calculate_reading_time(content: str) -> int:
     """Calculate estimated reading time in minutes (assuming 200 WPM)"""
-    word_count = len(content.split())
-    reading_time = max(1, round(word_count / 200))  # At least 1 minute
+    reading_time = max(1, round(calculate_word_count(content) / 200))  # At least 1 minute
     return reading_time
 
 
 def calculate_word_count(content: str) -> int:
-    """Calculate word count of content"""
+    """Calculate word count of content.
+
+    calculate_quality_score does not call this; it reads the word count
+    from the fused _content_stats pass to avoid a redundant traversal.
+    """
     return len(content.split())
 
 
 def extract_keywords(content: str, max_keywords: int = 10) -> List[str]:
     """Extract keywords from content (simple implementation)"""
-    # Remove common stop words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 
-                  'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 
-                  'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 
-                  'would', 'could', 'should', 'can', 'may', 'might', 'this', 
-                  'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 
-                  'we', 'they', 'me', 'him', 'her', 'us', 'them'}
-    
-    # Extract words (alphanumeric only)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
-    
-    # Filter stop words and count occurrences
-    word_count = {}
-    for word in words:
-        if word not in stop_words:
-            word_count[word] = word_count.get(word, 0) + 1
-    
-    # Sort by frequency and return top keywords
-    sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, count in sorted_words[:max_keywords]]
+    # Count non-stop words; Counter increments in C and most_common uses a
+    # size-N heap instead of sorting the whole vocabulary. Interning the
+    # tokens lets repeated words hit identity comparison in the set and
+    # Counter lookups
+    words = _WORD_RE.findall(content.lower())
+    word_count = Counter(
+        word for word in map(sys.intern, words) if word not in STOP_WORDS
+    )
+    return [word for word, count in word_count.most_common(max_keywords)]
 
 
 def calculate_engagement_score(views: int, likes: int, shares: int, comments: int, 
@@ -74,12 +118,72 @@ def calculate_engagement_score(views: int, likes: int, shares: int, comments: in
     return round(engagement_score, 2)
 
 
+def score_articles_bulk(views, likes, shares, comments, reading_time,
+                        time_spent_avg, published_at_ts, now_ts: float):
+    """Vectorized bulk variant of calculate_engagement_score and
+    calculate_trending_score for scoring many articles at once.
+
+    Accepts NumPy arrays (one element per article) plus epoch-second
+    timestamps and returns (engagement_scores, trending_scores) arrays.
+    Eliminates the per-article Python dispatch of the scalar functions.
+    """
+    import numpy as np  # heavy dependency, only needed for bulk scoring
+
+    views = np.asarray(views, dtype=np.float64)
+    likes = np.asarray(likes, dtype=np.float64)
+    shares = np.asarray(shares, dtype=np.float64)
+    comments = np.asarray(comments, dtype=np.float64)
+    reading_time = np.asarray(reading_time, dtype=np.float64)
+    time_spent_avg = np.asarray(time_spent_avg, dtype=np.float64)
+    published_at_ts = np.asarray(published_at_ts, dtype=np.float64)
+
+    # Engagement: rates normalized by views, zero where there are no views
+    safe_views = np.where(views > 0, views, 1.0)
+    like_rate = likes / safe_views
+    share_rate = shares / safe_views
+    comment_rate = comments / safe_views
+    safe_reading = np.where(reading_time > 0, reading_time, 1.0)
+    completion_rate = np.where(
+        reading_time > 0,
+        np.minimum(time_spent_avg / (safe_reading * 60), 1.0),
+        0.0
+    )
+    engagement = (
+        like_rate * 0.3 + share_rate * 0.3 +
+        comment_rate * 0.2 + completion_rate * 0.2
+    ) * 100
+    engagement = np.where(views > 0, engagement, 0.0).round(2)
+
+    # Trending: branchless time-decay lookup mirroring the scalar ladder
+    hours = (now_ts - published_at_ts) / 3600
+    factors = np.array([1.0, 0.8, 0.6, 0.4, 0.1])
+    thresholds = np.array([1.0, 24.0, 72.0, 168.0])
+    time_factor = factors[np.searchsorted(thresholds, hours, side='left')]
+    activity = views * 0.1 + likes * 2 + shares * 3 + comments * 2.5
+    trending = (activity * time_factor).round(2)
+
+    return engagement, trending
+
+
+def _content_stats(content: str) -> tuple:
+    """Compute word, sentence and paragraph statistics for content in one
+    pass per stat using C-level str primitives, avoiding the intermediate
+    sentence and paragraph lists"""
+    word_count = len(content.split())
+    sentence_count = content.count('.') + 1
+    # Words counted per sentence, i.e. after treating '.' as a separator
+    sentence_word_sum = len(content.replace('.', ' ').split())
+    paragraph_count = content.count('\n\n') + 1
+    return word_count, sentence_count, sentence_word_sum, paragraph_count
+
+
 def calculate_quality_score(content: str, title: str, summary: Optional[str] = None) -> float:
     """Calculate content quality score based on various factors"""
     score = 0.0
-    
+
+    word_count, sentence_count, sentence_word_sum, paragraph_count = _content_stats(content)
+
     # Content length score (0-30 points)
-    word_count = calculate_word_count(content)
     if word_count >= 500:
         score += 30
     elif word_count >= 300:
@@ -103,21 +207,18 @@ def calculate_quality_score(content: str, title: str, summary: Optional[str] = N
         score += 10
     
     # Readability score (0-20 points) - Simple sentence length check
-    sentences = content.split('.')
-    if sentences:
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
-        if 10 <= avg_sentence_length <= 20:
-            score += 20
-        elif 5 <= avg_sentence_length <= 25:
-            score += 15
-        else:
-            score += 10
-    
+    avg_sentence_length = sentence_word_sum / sentence_count
+    if 10 <= avg_sentence_length <= 20:
+        score += 20
+    elif 5 <= avg_sentence_length <= 25:
+        score += 15
+    else:
+        score += 10
+
     # Structure score (0-15 points) - Check for paragraphs
-    paragraphs = content.split('\n\n')
-    if len(paragraphs) >= 3:
+    if paragraph_count >= 3:
         score += 15
-    elif len(paragraphs) >= 2:
+    elif paragraph_count >= 2:
         score += 10
     else:
         score += 5
@@ -131,18 +232,12 @@ def calculate_trending_score(views: int, likes: int, shares: int, comments: int,
     if current_time is None:
         current_time = datetime.now()
     
-    # Time decay factor (more recent = higher score)
+    # Time decay factor (more recent = higher score); table lookup instead
+    # of a branch ladder
     hours_since_published = (current_time - published_at).total_seconds() / 3600
-    if hours_since_published <= 1:
-        time_factor = 1.0
-    elif hours_since_published <= 24:
-        time_factor = 0.8
-    elif hours_since_published <= 72:
-        time_factor = 0.6
-    elif hours_since_published <= 168:  # 1 week
-        time_factor = 0.4
-    else:
-        time_factor = 0.1
+    time_factor = _TRENDING_TIME_FACTORS[
+        bisect.bisect_left(_TRENDING_HOUR_THRESHOLDS, hours_since_published)
+    ]
     
     # Activity score
     activity_score = (views * 0.1 + likes * 2 + shares * 3 + comments * 2.5)
@@ -156,17 +251,28 @@ def calculate_trending_score(views: int, likes: int, shares: int, comments: int,
 def sanitize_html(content: str) -> str:
     """Basic HTML sanitization (remove dangerous tags)"""
     # Simple implementation - in production, use a proper HTML sanitizer
-    dangerous_tags = ['script', 'iframe', 'object', 'embed', 'form', 'input']
-    for tag in dangerous_tags:
-        content = re.sub(f'<{tag}[^>]*>.*?</{tag}>', '', content, flags=re.IGNORECASE | re.DOTALL)
-        content = re.sub(f'<{tag}[^>]*/?>', '', content, flags=re.IGNORECASE)
-    return content
+    return _VOID_TAG_RE.sub('', _PAIRED_TAG_RE.sub('', content))
 
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Structural check instead of invoking the regex engine: exactly one
+    # '@', allowed characters each side, and an alphabetic TLD of 2+ chars
+    at = email.find('@')
+    if at <= 0 or email.find('@', at + 1) != -1:
+        return False
+
+    local, domain = email[:at], email[at + 1:]
+    if not all(c in _EMAIL_LOCAL_CHARS for c in local):
+        return False
+
+    dot = domain.rfind('.')
+    if dot <= 0:
+        return False
+    tld = domain[dot + 1:]
+    if len(tld) < 2 or not (tld.isascii() and tld.isalpha()):
+        return False
+    return all(c in _EMAIL_DOMAIN_CHARS for c in domain[:dot])
 
 
 def generate_session_id(user_id: str, timestamp: datetime = None) -> str:
@@ -178,16 +284,22 @@ def generate_session_id(user_id: str, timestamp: datetime = None) -> str:
     return hashlib.sha256(session_data.encode()).hexdigest()
 
 
-def paginate_query_results(results: List[Any], page: int = 1, per_page: int = 20) -> Dict[str, Any]:
-    """Paginate query results"""
-    total = len(results)
+def paginate_query_results(results: Iterable[Any], page: int = 1, per_page: int = 20,
+                           total: Optional[int] = None) -> Dict[str, Any]:
+    """Paginate query results.
+
+    Accepts any iterable; pass total explicitly when streaming from a
+    generator or cursor so only the requested page is materialized.
+    """
+    if total is None:
+        total = len(results)
     pages = (total + per_page - 1) // per_page  # Ceiling division
-    
+
     start = (page - 1) * per_page
     end = start + per_page
-    
+
     return {
-        'data': results[start:end],
+        'data': list(itertools.islice(results, start, end)),
         'page': page,
         'per_page': per_page,
         'total': total,
@@ -202,59 +314,74 @@ def serialize_datetime(dt: datetime) -> str:
     return dt.isoformat() if dt else None
 
 
-def deserialize_datetime(dt_str: str) -> Optional[datetime]:
-    """Deserialize datetime from ISO format"""
-    if not dt_str:
-        return None
+@lru_cache(maxsize=8192)
+def _parse_iso(dt_str: str) -> Optional[datetime]:
+    """Parse an ISO datetime string, cached since timestamps repeat heavily
+    across bulk-loaded documents"""
     try:
         return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
     except ValueError:
         return None
 
 
+def deserialize_datetime(dt_str: str) -> Optional[datetime]:
+    """Deserialize datetime from ISO format"""
+    if not dt_str:
+        return None
+    return _parse_iso(dt_str)
+
+
 def safe_json_loads(json_str: str, default: Any = None) -> Any:
     """Safely load JSON with fallback"""
     try:
-        return json.loads(json_str) if json_str else default
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(json_str) if json_str else default
+    except (orjson.JSONDecodeError, TypeError):
         return default
 
 
 def safe_json_dumps(obj: Any) -> str:
     """Safely dump JSON with datetime handling"""
-    def json_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, uuid.UUID):
-            return str(obj)
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-    
+    # orjson serializes datetime, UUID and numpy values natively in C,
+    # avoiding the per-object Python default= callback
     try:
-        return json.dumps(obj, default=json_serializer)
-    except TypeError:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        ).decode()
+    except (orjson.JSONEncodeError, TypeError):
         return "{}"
 
 
 def cache_key_generator(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
-    key_parts = []
-    
-    # Add positional arguments
+    # Stream argument bytes straight into the hasher instead of building a
+    # list of strings and joining. xxh3 is an order of magnitude faster
+    # than cryptographic hashes and cache keys don't need collision
+    # resistance; BLAKE2b is the fallback when xxhash isn't installed
+    if xxhash is not None:
+        hasher = xxhash.xxh3_64()
+    else:
+        hasher = hashlib.blake2b(digest_size=8)
+
+    # Add positional arguments (NUL-separated to keep boundaries unambiguous)
     for arg in args:
         if isinstance(arg, (str, int, float, bool)):
-            key_parts.append(str(arg))
+            hasher.update(str(arg).encode())
         elif isinstance(arg, (list, tuple)):
-            key_parts.append(','.join(str(x) for x in arg))
+            for x in arg:
+                hasher.update(str(x).encode())
+                hasher.update(b',')
         else:
-            key_parts.append(str(hash(str(arg))))
-    
+            hasher.update(str(hash(str(arg))).encode())
+        hasher.update(b'\x00')
+
     # Add keyword arguments (sorted for consistency)
     for key, value in sorted(kwargs.items()):
-        key_parts.append(f"{key}={value}")
-    
-    # Create hash of combined key
-    key_string = ':'.join(key_parts)
-    return hashlib.md5(key_string.encode()).hexdigest()
+        hasher.update(key.encode())
+        hasher.update(b'=')
+        hasher.update(str(value).encode())
+        hasher.update(b'\x00')
+
+    return hasher.hexdigest()
 
 
 def health_check_service(service_name: str, check_function) -> Dict[str, str]:
@@ -268,20 +395,34 @@ def health_check_service(service_name: str, check_function) -> Dict[str, str]:
 
 class TimingContext:
     """Context manager for timing operations"""
-    
+
     def __init__(self):
-        self.start_time = None
-        self.end_time = None
+        self._wall_start = None
+        self._wall_end = None
+        self._t0 = None
         self.duration = None
-    
+
     def __enter__(self):
-        self.start_time = datetime.now()
+        self._wall_start = time.time()
+        self._t0 = time.perf_counter_ns()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = datetime.now()
-        self.duration = (self.end_time - self.start_time).total_seconds() * 1000  # milliseconds
-    
+        # Monotonic integer clock: no datetime/timedelta allocations and
+        # immune to wall-clock adjustments
+        self.duration = (time.perf_counter_ns() - self._t0) / 1_000_000.0
+        self._wall_end = time.time()
+
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Wall-clock start time (computed lazily)"""
+        return datetime.fromtimestamp(self._wall_start) if self._wall_start else None
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Wall-clock end time (computed lazily)"""
+        return datetime.fromtimestamp(self._wall_end) if self._wall_end else None
+
     def get_duration_ms(self) -> float:
         """Get duration in milliseconds"""
         return self.duration if self.duration is not None else 0.0
\ No newline at end of file
@@ -4,15 +4,18 @@ MongoDB Database Seeder for Decentralized News Application
 Seeds the MongoDB database with demo data for development and testing
 """
 
-import json
 import sys
 import os
 from datetime import datetime, timedelta
 import uuid
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
+import bson
+import numpy as np
+import orjson
+from pymongo import InsertOne, MongoClient, WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure
 
 # MongoDB configuration
 MONGO_CONFIG = {
@@ -31,12 +34,14 @@ def connect_mongodb():
                 host=MONGO_CONFIG['host'],
                 port=MONGO_CONFIG['port'],
                 username=MONGO_CONFIG['username'],
-                password=MONGO_CONFIG['password']
+                password=MONGO_CONFIG['password'],
+                maxPoolSize=16
             )
         else:
             client = MongoClient(
                 host=MONGO_CONFIG['host'],
-                port=MONGO_CONFIG['port']
+                port=MONGO_CONFIG['port'],
+                maxPoolSize=16
             )
         
         # Test connection
@@ -63,198 +68,266 @@ def load_demo_data():
     data = {}
     for key, filename in data_files.items():
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
-                # Convert datetime strings back to datetime objects
-                data[key] = convert_datetime_strings(raw_data)
+            with open(filename, 'rb') as f:
+                data[key] = orjson.loads(f.read())
             print(f"Loaded {len(data[key])} {key}")
         except FileNotFoundError:
             print(f"Demo data file not found: {filename}")
             print("Please run generate_demo_data.py first to create demo data.")
             sys.exit(1)
-    
-    return data
 
-def convert_datetime_strings(data: List[Dict]) -> List[Dict]:
-    """Convert ISO datetime strings to datetime objects"""
-    datetime_fields = [
-        'created_at', 'updated_at', 'last_active', 'published_at',
-        'confirmed_at', 'expires_at', 'training_date'
-    ]
-    
-    for item in data:
-        for field in datetime_fields:
-            if field in item and item[field]:
-                try:
-                    item[field] = datetime.fromisoformat(item[field].replace('Z', '+00:00'))
-                except (ValueError, AttributeError):
-                    pass
-    
     return data
 
-def transform_user_for_mongodb(user: Dict[str, Any]) -> Dict[str, Any]:
+def _dt(value):
+    """Parse an ISO datetime string, passing non-strings through unchanged.
+
+    Datetime parsing is fused into the transforms so only the fields each
+    document schema actually uses get converted, instead of rewriting every
+    document in a separate pass after loading.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return value
+    return value
+
+def _uuid_batch(n: int) -> List[str]:
+    """Generate n random UUID4 strings from a single os.urandom draw.
+
+    One syscall for all the entropy instead of one per uuid.uuid4() call;
+    the version/variant bits are patched so the results remain valid v4.
+    """
+    raw = bytearray(os.urandom(16 * n))
+    for i in range(n):
+        raw[i * 16 + 6] = (raw[i * 16 + 6] & 0x0F) | 0x40
+        raw[i * 16 + 8] = (raw[i * 16 + 8] & 0x3F) | 0x80
+    return [str(uuid.UUID(bytes=bytes(raw[i * 16:(i + 1) * 16]))) for i in range(n)]
+
+def transform_users_for_mongodb(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Transform user data for MongoDB schema"""
-    mongo_user = {
-        '_id': user['id'],
-        'username': user['username'],
-        'email': user['email'],
-        'password_hash': user['password_hash'],
-        'role': user['role'],
-        'did_address': user['did_address'],
-        'anonymous_mode': user['anonymous_mode'],
-        'profile_data': user['profile_data'],
-        'preferences': user['preferences'],
-        'created_at': user['created_at'],
-        'updated_at': user['updated_at'],
-        'last_active': user['last_active'],
-        'is_active': user['is_active'],
-        'verification_status': user['verification_status'],
-        'reputation_score': user['reputation_score'],
-        'follower_count': random.randint(0, 1000),
-        'following_count': random.randint(0, 500)
-    }
-    
-    return mongo_user
+    # Pre-draw all random values in bulk instead of two RNG calls per user
+    rng = np.random.default_rng()
+    follower_counts = rng.integers(0, 1001, size=len(users))
+    following_counts = rng.integers(0, 501, size=len(users))
 
-def transform_article_for_mongodb(article: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform article data for MongoDB schema"""
-    mongo_article = {
-        '_id': article['id'],
-        'title': article['title'],
-        'content': article['content'],
-        'summary': article['summary'],
-        'author_id': article['author_id'],
-        'anonymous_author': article['anonymous_author'],
-        'category': article['category'],
-        'subcategory': article['subcategory'],
-        'tags': article['tags'],
-        'language': article['language'],
-        'reading_time': article['reading_time'],
-        'word_count': article['word_count'],
-        'status': article['status'],
-        'published_at': article['published_at'],
-        'created_at': article['created_at'],
-        'updated_at': article['updated_at'],
-        'metadata': article['metadata'],
-        'engagement_metrics': {
-            'view_count': article['view_count'],
-            'like_count': article['like_count'],
-            'comment_count': article['comment_count'],
-            'share_count': article['share_count'],
-            'save_count': random.randint(0, article['like_count']),
-            'engagement_score': article['engagement_score'],
-            'quality_score': article['quality_score'],
-            'trending_score': article['trending_score']
-        },
-        'content_analysis': {
-            'sentiment_score': round(random.uniform(-1.0, 1.0), 3),
-            'readability_score': round(random.uniform(0.3, 0.9), 3),
-            'topics': [
-                {
-                    'name': random.choice(['politics', 'technology', 'sports', 'business']),
-                    'confidence': round(random.uniform(0.6, 0.95), 3)
-                }
-                for _ in range(random.randint(1, 3))
-            ],
-            'entities': [
-                {
-                    'text': random.choice(['Apple', 'Google', 'Microsoft', 'Tesla', 'OpenAI']),
-                    'type': 'ORGANIZATION',
-                    'confidence': round(random.uniform(0.7, 0.99), 3)
-                }
-                for _ in range(random.randint(0, 2))
-            ]
+    return [
+        {
+            '_id': user['id'],
+            'username': user['username'],
+            'email': user['email'],
+            'password_hash': user['password_hash'],
+            'role': user['role'],
+            'did_address': user['did_address'],
+            'anonymous_mode': user['anonymous_mode'],
+            'profile_data': user['profile_data'],
+            'preferences': user['preferences'],
+            'created_at': _dt(user['created_at']),
+            'updated_at': _dt(user['updated_at']),
+            'last_active': _dt(user['last_active']),
+            'is_active': user['is_active'],
+            'verification_status': user['verification_status'],
+            'reputation_score': user['reputation_score'],
+            'follower_count': int(follower_counts[i]),
+            'following_count': int(following_counts[i])
         }
-    }
-    
-    return mongo_article
+        for i, user in enumerate(users)
+    ]
+
+TOPIC_NAMES = ['politics', 'technology', 'sports', 'business']
+ENTITY_NAMES = ['Apple', 'Google', 'Microsoft', 'Tesla', 'OpenAI']
+
+def transform_articles_for_mongodb(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform article data for MongoDB schema"""
+    # Pre-draw all random values in bulk; the per-article RNG calls dominate
+    # transform time at seed scale
+    rng = np.random.default_rng()
+    n = len(articles)
+    save_fracs = rng.random(n)
+    sentiment_scores = rng.uniform(-1.0, 1.0, size=n).round(3)
+    readability_scores = rng.uniform(0.3, 0.9, size=n).round(3)
+    topic_counts = rng.integers(1, 4, size=n)
+    entity_counts = rng.integers(0, 3, size=n)
+    topic_names = rng.choice(TOPIC_NAMES, size=int(topic_counts.sum()))
+    topic_confidences = rng.uniform(0.6, 0.95, size=len(topic_names)).round(3)
+    entity_names = rng.choice(ENTITY_NAMES, size=int(entity_counts.sum()))
+    entity_confidences = rng.uniform(0.7, 0.99, size=len(entity_names)).round(3)
+
+    mongo_articles = []
+    topic_pos = 0
+    entity_pos = 0
+    for i, article in enumerate(articles):
+        topics = [
+            {
+                'name': str(topic_names[topic_pos + j]),
+                'confidence': float(topic_confidences[topic_pos + j])
+            }
+            for j in range(topic_counts[i])
+        ]
+        topic_pos += topic_counts[i]
+
+        entities = [
+            {
+                'text': str(entity_names[entity_pos + j]),
+                'type': 'ORGANIZATION',
+                'confidence': float(entity_confidences[entity_pos + j])
+            }
+            for j in range(entity_counts[i])
+        ]
+        entity_pos += entity_counts[i]
+
+        mongo_articles.append({
+            '_id': article['id'],
+            'title': article['title'],
+            'content': article['content'],
+            'summary': article['summary'],
+            'author_id': article['author_id'],
+            'anonymous_author': article['anonymous_author'],
+            'category': article['category'],
+            'subcategory': article['subcategory'],
+            'tags': article['tags'],
+            'language': article['language'],
+            'reading_time': article['reading_time'],
+            'word_count': article['word_count'],
+            'status': article['status'],
+            'published_at': _dt(article['published_at']),
+            'created_at': _dt(article['created_at']),
+            'updated_at': _dt(article['updated_at']),
+            'metadata': article['metadata'],
+            'engagement_metrics': {
+                'view_count': article['view_count'],
+                'like_count': article['like_count'],
+                'comment_count': article['comment_count'],
+                'share_count': article['share_count'],
+                'save_count': int(save_fracs[i] * (article['like_count'] + 1)),
+                'engagement_score': article['engagement_score'],
+                'quality_score': article['quality_score'],
+                'trending_score': article['trending_score']
+            },
+            'content_analysis': {
+                'sentiment_score': float(sentiment_scores[i]),
+                'readability_score': float(readability_scores[i]),
+                'topics': topics,
+                'entities': entities
+            }
+        })
+
+    return mongo_articles
 
-def transform_interaction_for_mongodb(interaction: Dict[str, Any]) -> Dict[str, Any]:
+def transform_interactions_for_mongodb(interactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Transform interaction data for MongoDB schema"""
-    mongo_interaction = {
-        '_id': interaction['id'],
-        'user_id': interaction['user_id'],
-        'article_id': interaction['article_id'],
-        'interaction_type': interaction['interaction_type'],
-        'interaction_strength': interaction['interaction_strength'],
-        'reading_progress': interaction['reading_progress'],
-        'time_spent': interaction['time_spent'],
-        'created_at': interaction['created_at'],
-        'session_id': interaction['session_id'],
-        'device_type': interaction['device_type'],
-        'context_data': interaction['context_data']
-    }
-    
-    return mongo_interaction
+    return [
+        {
+            '_id': interaction['id'],
+            'user_id': interaction['user_id'],
+            'article_id': interaction['article_id'],
+            'interaction_type': interaction['interaction_type'],
+            'interaction_strength': interaction['interaction_strength'],
+            'reading_progress': interaction['reading_progress'],
+            'time_spent': interaction['time_spent'],
+            'created_at': _dt(interaction['created_at']),
+            'session_id': interaction['session_id'],
+            'device_type': interaction['device_type'],
+            'context_data': interaction['context_data']
+        }
+        for interaction in interactions
+    ]
 
-def transform_embedding_for_mongodb(embedding: Dict[str, Any]) -> Dict[str, Any]:
+def transform_embeddings_for_mongodb(embeddings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Transform embedding data for MongoDB schema"""
-    mongo_embedding = {
-        '_id': embedding['id'],
-        'entity_id': embedding['entity_id'],
-        'entity_type': embedding['entity_type'],
-        'model_type': embedding['model_type'],
-        'embedding_vector': embedding['embedding_vector'],
-        'embedding_dimension': embedding['embedding_dimension'],
-        'model_version': embedding['model_version'],
-        'features': {
-            'text_features': None,
-            'behavioral_features': None,
-            'contextual_features': None,
-            'graph_features': None
-        },
-        'created_at': embedding['created_at'],
-        'updated_at': embedding['updated_at'],
-        'is_active': embedding['is_active']
-    }
-    
-    return mongo_embedding
+    return [
+        {
+            '_id': embedding['id'],
+            'entity_id': embedding['entity_id'],
+            'entity_type': embedding['entity_type'],
+            'model_type': embedding['model_type'],
+            'embedding_vector': embedding['embedding_vector'],
+            'embedding_dimension': embedding['embedding_dimension'],
+            'model_version': embedding['model_version'],
+            'features': {
+                'text_features': None,
+                'behavioral_features': None,
+                'contextual_features': None,
+                'graph_features': None
+            },
+            'created_at': _dt(embedding['created_at']),
+            'updated_at': _dt(embedding['updated_at']),
+            'is_active': embedding['is_active']
+        }
+        for embedding in embeddings
+    ]
 
 def seed_collection(db, collection_name: str, data: List[Dict], transform_func=None):
     """Seed a MongoDB collection with data"""
-    collection = db[collection_name]
-    
+    # Seeding does not need journaled acknowledgement per batch
+    collection = db.get_collection(
+        collection_name, write_concern=WriteConcern(w=1, j=False)
+    )
+
     # Clear existing data
     collection.delete_many({})
     print(f"Cleared existing data from {collection_name}")
-    
-    # Transform data if needed
+
+    # Transform data if needed (transforms operate on the full list so they
+    # can batch their random draws)
     if transform_func:
-        data = [transform_func(item) for item in data]
-    
-    # Insert data in batches
-    batch_size = 1000
+        data = transform_func(data)
+
+    if not data:
+        print(f"Seeded 0 documents in {collection_name}")
+        return
+
+    # Size batches against MongoDB's 16MB command limit instead of a fixed
+    # conservative 1000 docs, so small documents need far fewer round trips
+    avg_size = len(bson.encode(data[0]))
+    batch_size = max(1, min(10000, 12_000_000 // avg_size))
     total_inserted = 0
-    
+
     for i in range(0, len(data), batch_size):
         batch = data[i:i + batch_size]
         try:
-            result = collection.insert_many(batch, ordered=False)
-            total_inserted += len(result.inserted_ids)
-        except DuplicateKeyError as e:
-            print(f"Some duplicate keys in {collection_name}: {e}")
-    
+            result = collection.bulk_write(
+                [InsertOne(doc) for doc in batch],
+                ordered=False,
+                bypass_document_validation=True
+            )
+            total_inserted += result.inserted_count
+        except BulkWriteError as e:
+            total_inserted += e.details.get('nInserted', 0)
+            print(f"Some documents failed to insert in {collection_name}: "
+                  f"{len(e.details.get('writeErrors', []))} errors")
+
     print(f"Seeded {total_inserted} documents in {collection_name}")
 
+RECOMMENDATION_REASONS = ['reading history', 'similar users', 'content similarity', 'trending']
+
 def create_sample_recommendations(db, users: List[Dict], articles: List[Dict]):
     """Create sample recommendation documents"""
     recommendations = []
-    
+    rng = np.random.default_rng()
+
     # Create recommendations for first 100 users
-    for user in users[:100]:
+    rec_ids = _uuid_batch(min(100, len(users)))
+    for rec_idx, user in enumerate(users[:100]):
         recommended_articles = random.sample(articles, min(15, len(articles)))
-        
+
+        # Draw scores as an array and emit the entries directly in score
+        # order via argsort, instead of building dicts and re-sorting them
+        scores = rng.uniform(0.1, 0.95, size=len(recommended_articles)).round(4)
+        order = np.argsort(-scores)
+        reasons = rng.choice(RECOMMENDATION_REASONS, size=len(recommended_articles))
+
         recommendation = {
-            '_id': str(uuid.uuid4()),
+            '_id': rec_ids[rec_idx],
             'user_id': user['id'],
             'recommended_articles': [
                 {
-                    'article_id': article['id'],
-                    'score': round(random.uniform(0.1, 0.95), 4),
-                    'rank': i + 1,
-                    'reason': f"Based on {random.choice(['reading history', 'similar users', 'content similarity', 'trending'])}"
+                    'article_id': recommended_articles[j]['id'],
+                    'score': float(scores[j]),
+                    'rank': rank + 1,
+                    'reason': f"Based on {reasons[rank]}"
                 }
-                for i, article in enumerate(recommended_articles)
+                for rank, j in enumerate(order)
             ],
             'model_ensemble': random.choice([
                 'two_tower_v1.2',
@@ -281,59 +354,71 @@ def create_sample_recommendations(db, users: List[Dict], articles: List[Dict]):
             'expires_at': datetime.now() + timedelta(hours=random.randint(12, 48)),
             'is_active': True
         }
-        
-        # Sort recommended articles by score
-        recommendation['recommended_articles'].sort(key=lambda x: x['score'], reverse=True)
         recommendations.append(recommendation)
     
     seed_collection(db, 'recommendations', recommendations)
 
-def create_sample_comments(db, users: List[Dict], articles: List[Dict]):
+def create_sample_comments(db, users: List[Dict], articles: List[Dict], num_comments: int = 1000):
     """Create sample comments"""
+    # Pre-draw every random value in bulk instead of ~10 RNG calls per comment
+    rng = np.random.default_rng()
+    now = datetime.now()
+    user_indices = rng.integers(0, len(users), size=num_comments)
+    article_indices = rng.integers(0, len(articles), size=num_comments)
+    is_anonymous = rng.random(num_comments) < 0.5
+    created_days = rng.integers(0, 31, size=num_comments)
+    updated_days = rng.integers(0, 31, size=num_comments)
+    like_counts = rng.integers(0, 51, size=num_comments)
+    # Most approved
+    moderation_statuses = rng.choice(['approved', 'pending', 'approved', 'approved'],
+                                     size=num_comments)
+
+    comment_ids = _uuid_batch(num_comments)
     comments = []
-    
-    # Create 1000 random comments
-    for _ in range(1000):
-        user = random.choice(users)
-        article = random.choice(articles)
-        
-        comment = {
-            '_id': str(uuid.uuid4()),
+    for i in range(num_comments):
+        article = articles[article_indices[i]]
+        comments.append({
+            '_id': comment_ids[i],
             'article_id': article['id'],
-            'user_id': user['id'],
+            'user_id': users[user_indices[i]]['id'],
             'parent_comment_id': None,
             'content': f"This is a sample comment about {article['title'][:50]}...",
-            'is_anonymous': random.choice([True, False]),
-            'created_at': datetime.now() - timedelta(days=random.randint(0, 30)),
-            'updated_at': datetime.now() - timedelta(days=random.randint(0, 30)),
-            'like_count': random.randint(0, 50),
+            'is_anonymous': bool(is_anonymous[i]),
+            'created_at': now - timedelta(days=int(created_days[i])),
+            'updated_at': now - timedelta(days=int(updated_days[i])),
+            'like_count': int(like_counts[i]),
             'is_deleted': False,
-            'moderation_status': random.choice(['approved', 'pending', 'approved', 'approved'])  # Most approved
-        }
-        comments.append(comment)
-    
+            'moderation_status': str(moderation_statuses[i])
+        })
+
     seed_collection(db, 'comments', comments)
 
 def create_sample_did_identities(db, users: List[Dict]):
     """Create sample DID identities for users who want anonymous mode"""
     did_identities = []
     
-    anonymous_users = [u for u in users if u['anonymous_mode']]
-    
-    for user in anonymous_users:
-        if user['did_address']:
-            did_identity = {
-                '_id': str(uuid.uuid4()),
-                'user_id': user['id'],
-                'did_address': user['did_address'],
-                'public_key': f"0x{random.randbytes(32).hex()}",
-                'private_key_encrypted': f"encrypted_{random.randbytes(64).hex()}",
-                'blockchain_network': 'ethereum',
-                'verification_signature': f"0x{random.randbytes(65).hex()}",
-                'created_at': user['created_at'],
-                'is_active': True
-            }
-            did_identities.append(did_identity)
+    anonymous_users = [u for u in users if u['anonymous_mode'] and u['did_address']]
+
+    # One urandom syscall for all key material (32 + 64 + 65 bytes per user)
+    # instead of three randbytes calls per user
+    key_bytes = 32 + 64 + 65
+    blob = os.urandom(len(anonymous_users) * key_bytes)
+    did_ids = _uuid_batch(len(anonymous_users))
+
+    for i, user in enumerate(anonymous_users):
+        offset = i * key_bytes
+        did_identity = {
+            '_id': did_ids[i],
+            'user_id': user['id'],
+            'did_address': user['did_address'],
+            'public_key': f"0x{blob[offset:offset + 32].hex()}",
+            'private_key_encrypted': f"encrypted_{blob[offset + 32:offset + 96].hex()}",
+            'blockchain_network': 'ethereum',
+            'verification_signature': f"0x{blob[offset + 96:offset + 161].hex()}",
+            'created_at': _dt(user['created_at']),
+            'is_active': True
+        }
+        did_identities.append(did_identity)
     
     seed_collection(db, 'did_identities', did_identities)
 
@@ -399,18 +484,35 @@ def main():
     db = connect_mongodb()
     
     try:
-        # Seed collections
+        # Seed independent collections concurrently; pymongo is thread-safe
+        # and releases the GIL during socket I/O
         print("\nSeeding core collections...")
-        seed_collection(db, 'users', data['users'], transform_user_for_mongodb)
-        seed_collection(db, 'articles', data['articles'], transform_article_for_mongodb)
-        seed_collection(db, 'user_interactions', data['interactions'], transform_interaction_for_mongodb)
-        seed_collection(db, 'ml_embeddings', data['embeddings'], transform_embedding_for_mongodb)
-        
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [
+                executor.submit(seed_collection, db, 'users',
+                                data['users'], transform_users_for_mongodb),
+                executor.submit(seed_collection, db, 'articles',
+                                data['articles'], transform_articles_for_mongodb),
+                executor.submit(seed_collection, db, 'user_interactions',
+                                data['interactions'], transform_interactions_for_mongodb),
+                executor.submit(seed_collection, db, 'ml_embeddings',
+                                data['embeddings'], transform_embeddings_for_mongodb)
+            ]
+            for future in futures:
+                future.result()
+
         print("\nCreating additional collections...")
-        create_sample_recommendations(db, data['users'], data['articles'])
-        create_sample_comments(db, data['users'], data['articles'])
-        create_sample_did_identities(db, data['users'])
-        create_model_performance_records(db)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(create_sample_recommendations, db,
+                                data['users'], data['articles']),
+                executor.submit(create_sample_comments, db,
+                                data['users'], data['articles']),
+                executor.submit(create_sample_did_identities, db, data['users']),
+                executor.submit(create_model_performance_records, db)
+            ]
+            for future in futures:
+                future.result()
         
         print("\nMongoDB database seeding completed successfully!")
         print(f"Database: {MONGO_CONFIG['database']} at {MONGO_CONFIG['host']}:{MONGO_CONFIG['port']}")
@@ -6,7 +6,7 @@ CREATE TABLE IF NOT EXISTS user_embeddings (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     model_type recommendation_model NOT NULL,
-    embedding_vector DECIMAL[] NOT NULL, -- Store as array of decimals
+    embedding_vector REAL[] NOT NULL, -- Store as array of float32s
     embedding_dimension INTEGER NOT NULL,
     model_version VARCHAR(50) NOT NULL,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -20,7 +20,7 @@ CREATE TABLE IF NOT EXISTS article_embeddings (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     article_id UUID NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
     model_type recommendation_model NOT NULL,
-    embedding_vector DECIMAL[] NOT NULL,
+    embedding_vector REAL[] NOT NULL,
     embedding_dimension INTEGER NOT NULL,
     content_features JSONB DEFAULT '{}', -- CNN/RNN extracted features
     semantic_features JSONB DEFAULT '{}', -- GNN/Attention features
@@ -4,13 +4,33 @@ PostgreSQL Database Seeder for Decentralized News Application
 Seeds the PostgreSQL database with demo data for development and testing
 """
 
-import json
+import io
+import itertools
+import struct
+from concurrent.futures import ThreadPoolExecutor
+import ijson
+import numpy as np
+import orjson
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import register_adapter
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import Json, RealDictCursor, execute_values
 import sys
 import os
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Dict, Any
+from uuid import UUID
+
+class FastJson(Json):
+    """psycopg2 Json adapter that serializes with orjson"""
+
+    def dumps(self, obj):
+        return orjson.dumps(obj).decode()
+
+# Let bare dicts adapt straight to jsonb in parameterized statements; the
+# COPY text paths still pre-serialize since COPY needs literal text anyway
+register_adapter(dict, FastJson)
 
 # Database configuration
 DB_CONFIG = {
@@ -21,61 +41,190 @@ DB_CONFIG = {
     'password': os.getenv('POSTGRES_PASSWORD', 'password')
 }
 
+# Shared connection pool: the parallel seed workers check connections out
+# of it, and repeated runs inside one process (dev loops, CI harnesses that
+# import main) skip the TCP+auth handshake after the first connect
+_pool = None
+
+def _get_pool() -> ThreadedConnectionPool:
+    global _pool
+    if _pool is None:
+        try:
+            _pool = ThreadedConnectionPool(1, 8, **DB_CONFIG)
+        except psycopg2.Error as e:
+            print(f"Error connecting to PostgreSQL: {e}")
+            sys.exit(1)
+    return _pool
+
 def connect_db():
-    """Connect to PostgreSQL database"""
-    try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        conn.autocommit = False
-        return conn
-    except psycopg2.Error as e:
-        print(f"Error connecting to PostgreSQL: {e}")
-        sys.exit(1)
+    """Check a PostgreSQL connection out of the shared pool"""
+    conn = _get_pool().getconn()
+    conn.autocommit = False
+    return conn
+
+def release_db(conn):
+    """Return a connection to the shared pool"""
+    _get_pool().putconn(conn)
 
 def load_demo_data():
-    """Load demo data from JSON files"""
+    """Load demo data from JSON files.
+
+    Users are small and reused by several seed steps, so they load as a
+    list; articles, interactions and embeddings stream through ijson so
+    only one batch of documents is materialized at a time.
+    """
     # Get the correct path to the seeds directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    seeds_dir = os.path.join(os.path.dirname(os.path.dirname(current_dir)), 'seeds')
-    
+    seeds_dir = Path(__file__).resolve().parents[2] / 'seeds'
+
     data_files = {
-        'users': os.path.join(seeds_dir, 'demo_users.json'),
-        'articles': os.path.join(seeds_dir, 'demo_articles.json'),
-        'interactions': os.path.join(seeds_dir, 'demo_interactions.json'),
-        'embeddings': os.path.join(seeds_dir, 'demo_embeddings.json')
+        key: seeds_dir / f'demo_{key}.json'
+        for key in ('users', 'articles', 'interactions', 'embeddings')
     }
-    
-    data = {}
-    for key, filename in data_files.items():
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data[key] = json.load(f)
-            print(f"Loaded {len(data[key])} {key}")
-        except FileNotFoundError:
+
+    for filename in data_files.values():
+        if not filename.exists():
             print(f"Demo data file not found: {filename}")
             print("Please run generate_demo_data.py first to create demo data.")
             sys.exit(1)
-    
+
+    data = {}
+    with open(data_files['users'], 'rb') as f:
+        data['users'] = orjson.loads(f.read())
+    print(f"Loaded {len(data['users'])} users")
+
+    for key in ('articles', 'interactions', 'embeddings'):
+        data[key] = ijson.items(open(data_files[key], 'rb'), 'item')
+        print(f"Streaming {key} from {data_files[key]}")
+
     return data
 
-def seed_users(conn, users: List[Dict[str, Any]]):
-    """Seed users table"""
-    cursor = conn.cursor()
-    
-    # Clear existing data
-    cursor.execute("TRUNCATE TABLE users CASCADE")
-    
-    insert_query = """
-    INSERT INTO users (
-        id, username, email, password_hash, role, did_address, anonymous_mode,
-        created_at, updated_at, last_active, is_active, profile_data, 
-        preferences, verification_status, reputation_score
-    ) VALUES (
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+def _batches(iterable: Iterable[Any], size: int):
+    """Yield lists of up to `size` items from any iterable"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _pg_array(values: Iterable[Any]) -> str:
+    """Format a Python sequence as a PostgreSQL array literal"""
+    return '{%s}' % ','.join(
+        '"%s"' % str(v).replace('\\', '\\\\').replace('"', '\\"') for v in values
+    )
+
+def _copy_field(value: Any) -> str:
+    """Format a single value for COPY ... FROM STDIN (FORMAT text)"""
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, (list, tuple)):
+        value = _pg_array(value)
+    elif not isinstance(value, str):
+        value = str(value)
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+# Binary COPY field encoders. Each returns the PostgreSQL binary wire
+# representation of one value; None is handled by copy_binary_rows.
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_FLOAT4_OID = 700
+
+def _bin_uuid(value: str) -> bytes:
+    return UUID(value).bytes
+
+def _bin_text(value: str) -> bytes:
+    return value.encode('utf-8')
+
+def _bin_int4(value: int) -> bytes:
+    return struct.pack('>i', value)
+
+def _bin_bool(value: bool) -> bytes:
+    return b'\x01' if value else b'\x00'
+
+def _bin_timestamp(value) -> bytes:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    micros = round((value - _PG_EPOCH).total_seconds() * 1_000_000)
+    return struct.pack('>q', micros)
+
+def _bin_jsonb(value) -> bytes:
+    return b'\x01' + orjson.dumps(value)
+
+def _bin_real_array(values) -> bytes:
+    # float4 is the narrowest element type the real[] columns support;
+    # halfvec/int8 quantization would need pgvector, which the schema does
+    # not use. Packing with 'f' already truncates Python's float64s to
+    # float32 on the way out.
+    # Array header: ndim, null bitmap flag, element oid, length, lower bound,
+    # then (length, float4) per element
+    count = len(values)
+    return struct.pack('>iiiii', 1, 0, _FLOAT4_OID, count, 1) + struct.pack(
+        '>' + 'if' * count, *itertools.chain.from_iterable((4, float(v)) for v in values)
     )
+
+def copy_binary_rows(cursor, table: str, columns: List[str],
+                     encoders: List[Any], rows: Iterable[tuple]):
+    """Bulk-load rows with COPY ... FROM STDIN (FORMAT BINARY).
+
+    Binary COPY skips the float -> text -> float round trip for the wide
+    embedding_vector arrays: each float32 costs 8 bytes on the wire
+    instead of ~12 ASCII characters plus reparsing on the server.
     """
-    
+    buf = io.BytesIO()
+    buf.write(b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0))
+    field_count = struct.pack('>h', len(columns))
+    for row in rows:
+        buf.write(field_count)
+        for encoder, value in zip(encoders, row):
+            if value is None:
+                buf.write(struct.pack('>i', -1))
+            else:
+                field = encoder(value)
+                buf.write(struct.pack('>i', len(field)))
+                buf.write(field)
+    buf.write(struct.pack('>h', -1))
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT BINARY)",
+        buf
+    )
+
+def copy_rows(cursor, table: str, columns: List[str], rows: Iterable[tuple]):
+    """Bulk-load rows into a table with a single COPY FROM STDIN.
+
+    One statement and one round-trip per table instead of one INSERT per
+    row, which is the dominant cost when seeding tens of thousands of rows.
+    If a future table can't go through COPY (e.g. it needs ON CONFLICT),
+    prefer PREPARE ... / EXECUTE over raw per-row INSERTs so the server
+    parses and plans the statement once.
+    """
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join(_copy_field(value) for value in row))
+        buf.write('\n')
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)",
+        buf
+    )
+
+def seed_users(conn, users: List[Dict[str, Any]]):
+    """Seed users and user_preferences tables"""
+    cursor = conn.cursor()
+
+    # Both tables derive from the same list, so stage both row sets in a
+    # single pass instead of walking users twice
+    user_rows = []
+    pref_rows = []
     for user in users:
-        cursor.execute(insert_query, (
+        preferences = user['preferences']
+        user_rows.append((
             user['id'],
             user['username'],
             user['email'],
@@ -87,229 +236,337 @@ def seed_users(conn, users: List[Dict[str, Any]]):
             user['updated_at'],
             user['last_active'],
             user['is_active'],
-            json.dumps(user['profile_data']),
-            json.dumps(user['preferences']),
+            orjson.dumps(user['profile_data']).decode(),
+            orjson.dumps(preferences).decode(),
             user['verification_status'],
             user['reputation_score']
         ))
-    
-    # Insert user preferences
-    cursor.execute("TRUNCATE TABLE user_preferences CASCADE")
-    
-    pref_insert_query = """
-    INSERT INTO user_preferences (
-        user_id, categories, languages, reading_time_preference,
-        content_freshness_weight, diversity_preference, personalization_level,
-        explicit_feedback, created_at, updated_at
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    
-    for user in users:
-        prefs = user['preferences']
-        cursor.execute(pref_insert_query, (
+        pref_rows.append((
             user['id'],
-            prefs['categories'],
-            prefs['languages'],
-            prefs['reading_time_preference'],
-            prefs['content_freshness_weight'],
-            prefs['diversity_preference'],
-            prefs['personalization_level'],
-            json.dumps({}),  # explicit_feedback
+            preferences['categories'],
+            preferences['languages'],
+            preferences['reading_time_preference'],
+            preferences['content_freshness_weight'],
+            preferences['diversity_preference'],
+            preferences['personalization_level'],
+            '{}',  # explicit_feedback
             user['created_at'],
             user['updated_at']
         ))
-    
-    conn.commit()
+
+    copy_rows(cursor, 'users', [
+        'id', 'username', 'email', 'password_hash', 'role', 'did_address',
+        'anonymous_mode', 'created_at', 'updated_at', 'last_active',
+        'is_active', 'profile_data', 'preferences', 'verification_status',
+        'reputation_score'
+    ], user_rows)
+
+    copy_rows(cursor, 'user_preferences', [
+        'user_id', 'categories', 'languages', 'reading_time_preference',
+        'content_freshness_weight', 'diversity_preference',
+        'personalization_level', 'explicit_feedback', 'created_at', 'updated_at'
+    ], pref_rows)
+
     print(f"Seeded {len(users)} users and preferences")
 
-def seed_articles(conn, articles: List[Dict[str, Any]]):
-    """Seed articles table"""
-    cursor = conn.cursor()
-    
-    # Clear existing data
-    cursor.execute("TRUNCATE TABLE articles CASCADE")
-    
-    insert_query = """
-    INSERT INTO articles (
-        id, title, content, summary, author_id, anonymous_author, category,
-        subcategory, tags, language, reading_time, word_count, status,
-        published_at, created_at, updated_at, metadata, source_url, image_urls,
-        seo_keywords, engagement_score, quality_score, trending_score,
-        view_count, like_count, comment_count, share_count
-    ) VALUES (
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-    )
-    """
-    
-    for article in articles:
-        cursor.execute(insert_query, (
-            article['id'],
-            article['title'],
-            article['content'],
-            article['summary'],
-            article['author_id'],
-            article['anonymous_author'],
-            article['category'],
-            article['subcategory'],
-            article['tags'],
-            article['language'],
-            article['reading_time'],
-            article['word_count'],
-            article['status'],
-            article['published_at'],
-            article['created_at'],
-            article['updated_at'],
-            json.dumps(article['metadata']),
-            article['metadata'].get('source_url'),
-            article['metadata'].get('image_urls', []),
-            article['metadata'].get('seo_keywords', []),
-            article['engagement_score'],
-            article['quality_score'],
-            article['trending_score'],
-            article['view_count'],
-            article['like_count'],
-            article['comment_count'],
-            article['share_count']
-        ))
-    
-    conn.commit()
-    print(f"Seeded {len(articles)} articles")
+ARTICLE_COLUMNS = [
+    'id', 'title', 'content', 'summary', 'author_id', 'anonymous_author',
+    'category', 'subcategory', 'tags', 'language', 'reading_time',
+    'word_count', 'status', 'published_at', 'created_at', 'updated_at',
+    'metadata', 'source_url', 'image_urls', 'seo_keywords',
+    'engagement_score', 'quality_score', 'trending_score', 'view_count',
+    'like_count', 'comment_count', 'share_count'
+]
 
-def seed_interactions(conn, interactions: List[Dict[str, Any]]):
-    """Seed user_interactions table"""
+def seed_articles(conn, articles: Iterable[Dict[str, Any]]) -> List[str]:
+    """Seed articles table from a stream, returning the inserted ids"""
     cursor = conn.cursor()
-    
-    # Clear existing data
-    cursor.execute("TRUNCATE TABLE user_interactions CASCADE")
-    
-    insert_query = """
-    INSERT INTO user_interactions (
-        id, user_id, article_id, interaction_type, interaction_strength,
-        reading_progress, time_spent, created_at, session_id, device_type,
-        context_data
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+
+    article_ids = []
+    for batch in _batches(articles, 1000):
+        article_ids.extend(article['id'] for article in batch)
+        # Stage the batch as tuples first so the dict lookups run in one
+        # tight loop, then hand the finished list to the COPY encoder
+        rows = [
+            (
+                article['id'],
+                article['title'],
+                article['content'],
+                article['summary'],
+                article['author_id'],
+                article['anonymous_author'],
+                article['category'],
+                article['subcategory'],
+                article['tags'],
+                article['language'],
+                article['reading_time'],
+                article['word_count'],
+                article['status'],
+                article['published_at'],
+                article['created_at'],
+                article['updated_at'],
+                orjson.dumps(article['metadata']).decode(),
+                article['metadata'].get('source_url'),
+                article['metadata'].get('image_urls', []),
+                article['metadata'].get('seo_keywords', []),
+                article['engagement_score'],
+                article['quality_score'],
+                article['trending_score'],
+                article['view_count'],
+                article['like_count'],
+                article['comment_count'],
+                article['share_count']
+            )
+            for article in batch
+        ]
+        copy_rows(cursor, 'articles', ARTICLE_COLUMNS, rows)
+
+    print(f"Seeded {len(article_ids)} articles")
+    return article_ids
+
+INTERACTION_COLUMNS = [
+    'id', 'user_id', 'article_id', 'interaction_type',
+    'interaction_strength', 'reading_progress', 'time_spent',
+    'created_at', 'session_id', 'device_type', 'context_data'
+]
+
+def seed_interactions(conn, interactions: Iterable[Dict[str, Any]]):
+    """Seed user_interactions table from a stream.
+
+    Interactions are the biggest input by far, so the pipeline never
+    holds more than one 1000-row batch: ijson yields dicts one at a
+    time, _batches slices them, and each staged batch is released before
+    the next is pulled.
     """
-    
-    for interaction in interactions:
-        cursor.execute(insert_query, (
-            interaction['id'],
-            interaction['user_id'],
-            interaction['article_id'],
-            interaction['interaction_type'],
-            interaction['interaction_strength'],
-            interaction['reading_progress'],
-            interaction['time_spent'],
-            interaction['created_at'],
-            interaction['session_id'],
-            interaction['device_type'],
-            json.dumps(interaction['context_data'])
-        ))
-    
-    conn.commit()
-    print(f"Seeded {len(interactions)} user interactions")
+    cursor = conn.cursor()
 
-def seed_ml_embeddings(conn, embeddings: List[Dict[str, Any]]):
-    """Seed ML embedding tables"""
+    total = 0
+    for batch in _batches(interactions, 1000):
+        total += len(batch)
+        rows = [
+            (
+                interaction['id'],
+                interaction['user_id'],
+                interaction['article_id'],
+                interaction['interaction_type'],
+                interaction['interaction_strength'],
+                interaction['reading_progress'],
+                interaction['time_spent'],
+                interaction['created_at'],
+                interaction['session_id'],
+                interaction['device_type'],
+                orjson.dumps(interaction['context_data']).decode()
+            )
+            for interaction in batch
+        ]
+        copy_rows(cursor, 'user_interactions', INTERACTION_COLUMNS, rows)
+
+    print(f"Seeded {total} user interactions")
+
+USER_EMBEDDING_COLUMNS = [
+    'id', 'user_id', 'model_type', 'embedding_vector',
+    'embedding_dimension', 'model_version', 'created_at', 'updated_at',
+    'is_active'
+]
+
+ARTICLE_EMBEDDING_COLUMNS = [
+    'id', 'article_id', 'model_type', 'embedding_vector',
+    'embedding_dimension', 'content_features', 'semantic_features',
+    'model_version', 'created_at', 'updated_at', 'is_active'
+]
+
+USER_EMBEDDING_ENCODERS = [
+    _bin_uuid, _bin_uuid, _bin_text, _bin_real_array, _bin_int4,
+    _bin_text, _bin_timestamp, _bin_timestamp, _bin_bool
+]
+
+ARTICLE_EMBEDDING_ENCODERS = [
+    _bin_uuid, _bin_uuid, _bin_text, _bin_real_array, _bin_int4,
+    _bin_jsonb, _bin_jsonb, _bin_text, _bin_timestamp, _bin_timestamp,
+    _bin_bool
+]
+
+def seed_ml_embeddings(conn, embeddings: Iterable[Dict[str, Any]]):
+    """Seed ML embedding tables from a stream"""
     cursor = conn.cursor()
-    
-    # Clear existing data
-    cursor.execute("TRUNCATE TABLE user_embeddings CASCADE")
-    cursor.execute("TRUNCATE TABLE article_embeddings CASCADE")
-    
-    user_embed_query = """
-    INSERT INTO user_embeddings (
-        id, user_id, model_type, embedding_vector, embedding_dimension,
-        model_version, created_at, updated_at, is_active
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    
-    article_embed_query = """
-    INSERT INTO article_embeddings (
-        id, article_id, model_type, embedding_vector, embedding_dimension,
-        content_features, semantic_features, model_version, created_at,
-        updated_at, is_active
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    
-    user_embeddings = [e for e in embeddings if e['entity_type'] == 'user']
-    article_embeddings = [e for e in embeddings if e['entity_type'] == 'article']
-    
-    for embedding in user_embeddings:
-        cursor.execute(user_embed_query, (
-            embedding['id'],
-            embedding['entity_id'],
-            embedding['model_type'],
-            embedding['embedding_vector'],
-            embedding['embedding_dimension'],
-            embedding['model_version'],
-            embedding['created_at'],
-            embedding['updated_at'],
-            embedding['is_active']
+
+    user_count = 0
+    article_count = 0
+    checked = False
+    for batch in _batches(embeddings, 1000):
+        if not checked:
+            # Spot-check the stream before loading anything. The dimension
+            # can't be hoisted to a per-table constant (each model_type has
+            # its own), but it must agree with the vector it describes.
+            for embedding in batch[:100]:
+                if embedding['embedding_dimension'] != len(embedding['embedding_vector']):
+                    raise ValueError(
+                        f"embedding {embedding['id']} declares dimension "
+                        f"{embedding['embedding_dimension']} but carries "
+                        f"{len(embedding['embedding_vector'])} values"
+                    )
+            checked = True
+        user_embeddings = [e for e in batch if e['entity_type'] == 'user']
+        article_embeddings = [e for e in batch if e['entity_type'] == 'article']
+        user_count += len(user_embeddings)
+        article_count += len(article_embeddings)
+
+        copy_binary_rows(cursor, 'user_embeddings', USER_EMBEDDING_COLUMNS,
+                         USER_EMBEDDING_ENCODERS, (
+            (
+                embedding['id'],
+                embedding['entity_id'],
+                embedding['model_type'],
+                embedding['embedding_vector'],
+                embedding['embedding_dimension'],
+                embedding['model_version'],
+                embedding['created_at'],
+                embedding['updated_at'],
+                embedding['is_active']
+            )
+            for embedding in user_embeddings
         ))
-    
-    for embedding in article_embeddings:
-        cursor.execute(article_embed_query, (
-            embedding['id'],
-            embedding['entity_id'],
-            embedding['model_type'],
-            embedding['embedding_vector'],
-            embedding['embedding_dimension'],
-            json.dumps({}),  # content_features
-            json.dumps({}),  # semantic_features
-            embedding['model_version'],
-            embedding['created_at'],
-            embedding['updated_at'],
-            embedding['is_active']
+
+        copy_binary_rows(cursor, 'article_embeddings', ARTICLE_EMBEDDING_COLUMNS,
+                         ARTICLE_EMBEDDING_ENCODERS, (
+            (
+                embedding['id'],
+                embedding['entity_id'],
+                embedding['model_type'],
+                embedding['embedding_vector'],
+                embedding['embedding_dimension'],
+                {},  # content_features
+                {},  # semantic_features
+                embedding['model_version'],
+                embedding['created_at'],
+                embedding['updated_at'],
+                embedding['is_active']
+            )
+            for embedding in article_embeddings
         ))
-    
-    conn.commit()
-    print(f"Seeded {len(user_embeddings)} user embeddings and {len(article_embeddings)} article embeddings")
 
-def create_sample_recommendations(conn, users: List[Dict[str, Any]], articles: List[Dict[str, Any]]):
+    print(f"Seeded {user_count} user embeddings and {article_count} article embeddings")
+
+def create_sample_recommendations(conn, users: List[Dict[str, Any]], article_ids: List[str]):
     """Create sample recommendation cache entries"""
-    cursor = conn.cursor()
-    
-    cursor.execute("TRUNCATE TABLE recommendation_cache CASCADE")
-    
     insert_query = """
     INSERT INTO recommendation_cache (
         id, user_id, recommended_articles, recommendation_scores,
         recommendation_reasons, model_ensemble, cache_timestamp,
         expiry_timestamp, impression_count, click_through_rate, is_active
-    ) VALUES (%s, %s, %s::uuid[], %s, %s, %s, %s, %s, %s, %s, %s)
+    ) VALUES %s
     """
-    
+
     import uuid
     from datetime import datetime, timedelta
     import random
-    
-    # Create recommendations for first 100 users
-    for user in users[:100]:
+
+    target_users = users[:100]
+    per_user = min(20, len(article_ids))
+    rng = np.random.default_rng()
+
+    # Draw every random value for the batch up front with vectorized numpy
+    # calls; the loop below only assembles rows
+    all_scores = np.round(
+        np.sort(rng.uniform(0.1, 0.95, (len(target_users), per_user)), axis=1)[:, ::-1],
+        4
+    ).tolist()
+    ctrs = np.round(rng.uniform(0.02, 0.15, len(target_users)), 4).tolist()
+    impressions = rng.integers(0, 6, len(target_users)).tolist()
+
+    now = datetime.now()
+    expiry = now + timedelta(hours=24)
+
+    # Build all rows first, then send them in one multi-VALUES statement;
+    # the cursor only opens once the payloads are ready so no server-side
+    # resources sit idle during the Python work
+    rows = []
+    for i, user in enumerate(target_users):
         # Select random articles for recommendation
-        recommended_article_ids = [a['id'] for a in random.sample(articles, min(20, len(articles)))]
-        scores = [round(random.uniform(0.1, 0.95), 4) for _ in recommended_article_ids]
-        scores.sort(reverse=True)  # Sort scores in descending order
-        
-        reasons = {str(i): f"Based on {random.choice(['reading history', 'similar users', 'content similarity', 'trending'])}" 
-                  for i, _ in enumerate(recommended_article_ids)}
-        
-        cursor.execute(insert_query, (
+        recommended_article_ids = random.sample(article_ids, per_user)
+
+        reasons = {str(j): f"Based on {random.choice(['reading history', 'similar users', 'content similarity', 'trending'])}"
+                  for j, _ in enumerate(recommended_article_ids)}
+
+        rows.append((
             str(uuid.uuid4()),
             user['id'],
-            recommended_article_ids,  # Keep as strings, PostgreSQL will cast to UUID[]
-            scores,
-            json.dumps(reasons),
+            recommended_article_ids,  # list adapts to ARRAY[...] once; ::uuid[] in the template casts server-side
+            all_scores[i],
+            FastJson(reasons),
             "two_tower+cnn+diversity_rerank",
-            datetime.now(),
-            datetime.now() + timedelta(hours=24),
-            random.randint(0, 5),
-            round(random.uniform(0.02, 0.15), 4),
+            now,
+            expiry,
+            impressions[i],
+            ctrs[i],
             True
         ))
-    
-    conn.commit()
+
+    cursor = conn.cursor()
+    execute_values(
+        cursor, insert_query, rows,
+        template="(%s, %s, %s::uuid[], %s, %s, %s, %s, %s, %s, %s, %s)",
+        page_size=1000
+    )
+
     print("Created sample recommendation cache entries")
 
+SEEDED_TABLES = ('users', 'user_preferences', 'articles', 'user_interactions',
+                 'user_embeddings', 'article_embeddings', 'recommendation_cache')
+
+def drop_secondary_indexes(conn):
+    """Drop non-unique indexes on the seeded tables, returning their DDL.
+
+    Maintaining secondary indexes row by row during a bulk load is
+    O(N log N) of scattered btree updates; rebuilding each index once at
+    the end is a single bulk sort. Unique indexes stay in place since they
+    back primary key and uniqueness constraints.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE schemaname = 'public' AND tablename IN %s
+          AND indexdef NOT LIKE 'CREATE UNIQUE%%'
+    """, (SEEDED_TABLES,))
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f"DROP INDEX {name}")
+    cursor.close()
+    return indexes
+
+def restore_secondary_indexes(conn, indexes):
+    """Recreate indexes previously dropped by drop_secondary_indexes"""
+    cursor = conn.cursor()
+    for _, indexdef in indexes:
+        cursor.execute(indexdef)
+    cursor.close()
+
+def _tune_session(conn):
+    """Bulk-load session tuning: skip the per-commit WAL fsync and give
+    sorts/index maintenance more memory. Safe because the seeder is
+    re-runnable if it dies mid-way.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SET synchronous_commit = OFF")
+    cursor.execute("SET work_mem = '256MB'")
+    cursor.execute("SET maintenance_work_mem = '1GB'")
+    cursor.close()
+
+def _seed_on_own_connection(seed_fn, *args):
+    """Run one seed step on a dedicated connection and commit it.
+
+    The heavy tables are disjoint, so seeding them over separate
+    connections lets the server overlap their WAL and heap writes.
+    """
+    conn = connect_db()
+    try:
+        _tune_session(conn)
+        result = seed_fn(conn, *args)
+        conn.commit()
+        return result
+    finally:
+        release_db(conn)
+
 def main():
     """Main seeding function"""
     print("Starting PostgreSQL database seeding...")
@@ -319,24 +576,74 @@ def main():
     
     # Connect to database
     conn = connect_db()
-    
+    indexes = []
+    schema_degraded = False
+
     try:
-        # Seed data in order (respecting foreign key constraints)
+        _tune_session(conn)
+
+        # Clear all seeded tables in one statement: one round-trip and one
+        # lock acquisition cycle instead of one TRUNCATE per table
+        cursor = conn.cursor()
+        cursor.execute(
+            "TRUNCATE TABLE users, user_preferences, articles, "
+            "user_interactions, user_embeddings, article_embeddings, "
+            "recommendation_cache CASCADE"
+        )
+        # Skip per-row trigger and FK-lookup work during the load; the demo
+        # generator only emits references to rows it also emits
+        for table in SEEDED_TABLES:
+            cursor.execute(f"ALTER TABLE {table} DISABLE TRIGGER ALL")
+        cursor.close()
+
+        indexes = drop_secondary_indexes(conn)
+
+        # Commit the DDL phase so the worker connections below see it
+        conn.commit()
+        schema_degraded = True
+
+        # Users first (everything references them), articles next, then the
+        # three steps that only depend on users+articles run concurrently on
+        # their own connections
         seed_users(conn, data['users'])
-        seed_articles(conn, data['articles'])
-        seed_interactions(conn, data['interactions'])
-        seed_ml_embeddings(conn, data['embeddings'])
-        create_sample_recommendations(conn, data['users'], data['articles'])
-        
+        conn.commit()
+        article_ids = seed_articles(conn, data['articles'])
+        conn.commit()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(_seed_on_own_connection, seed_interactions,
+                            data['interactions']),
+                pool.submit(_seed_on_own_connection, seed_ml_embeddings,
+                            data['embeddings']),
+                pool.submit(_seed_on_own_connection, create_sample_recommendations,
+                            data['users'], article_ids),
+            ]
+            for future in futures:
+                future.result()
+
         print("\nPostgreSQL database seeding completed successfully!")
         print(f"Database: {DB_CONFIG['database']} at {DB_CONFIG['host']}:{DB_CONFIG['port']}")
-        
+
     except Exception as e:
         conn.rollback()
         print(f"Error during seeding: {e}")
         sys.exit(1)
     finally:
-        conn.close()
+        # The DDL phase was committed, so rebuild the dropped indexes and
+        # re-arm the triggers even when a seed step fails: a run that
+        # bailed out here would otherwise leave the schema degraded, and a
+        # re-run could not rediscover the dropped DDL from pg_indexes
+        try:
+            if schema_degraded:
+                restore_secondary_indexes(conn, indexes)
+                cursor = conn.cursor()
+                for table in SEEDED_TABLES:
+                    cursor.execute(f"ALTER TABLE {table} ENABLE TRIGGER ALL")
+                cursor.close()
+                conn.commit()
+        finally:
+            release_db(conn)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
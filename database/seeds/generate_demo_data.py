@@ -5,18 +5,28 @@ Generates realistic demo data for users, articles, interactions for ML recommend
 """
 
 import json
+import orjson
 import random
+from concurrent.futures import ProcessPoolExecutor
 import uuid
 import os
-import csv
 from datetime import datetime, timedelta
 from faker import Faker
 import numpy as np
+import pandas as pd
 from typing import List, Dict, Any
 import hashlib
 
-# Initialize Faker for different locales
-fake = Faker(['en_US', 'en_GB', 'es_ES', 'fr_FR', 'de_DE'])
+# Initialize Faker for different locales. Single-locale instances picked at
+# random skip the per-call proxy dispatch a multi-locale Faker([...]) pays,
+# and seeding once keeps runs reproducible
+LOCALES = ('en_US', 'en_GB', 'es_ES', 'fr_FR', 'de_DE')
+Faker.seed(0)
+_fakers = {locale: Faker(locale) for locale in LOCALES}
+
+def _fk() -> Faker:
+    """Pick a random single-locale Faker instance"""
+    return _fakers[random.choice(LOCALES)]
 
 # Categories and their subcategories
 NEWS_CATEGORIES = {
@@ -32,8 +42,19 @@ NEWS_CATEGORIES = {
 
 LANGUAGES = ['en', 'es', 'fr', 'de', 'it', 'pt']
 
+# Shared pools sampled by the article/user generators; built once instead
+# of a fresh list(NEWS_CATEGORIES.keys()) or 20 fake.word() calls per row
+_CAT_KEYS = list(NEWS_CATEGORIES.keys())
+_WORD_POOL = [_fk().word() for _ in range(4096)]
+
 INTERACTION_TYPES = ['like', 'dislike', 'save', 'share', 'view', 'comment']
 
+DEVICE_TYPES = ['desktop', 'mobile', 'tablet']
+REFERRERS = [None, 'google', 'twitter', 'facebook', 'direct']
+TIMES_OF_DAY = ['morning', 'afternoon', 'evening', 'night']
+DAYS_OF_WEEK = ['monday', 'tuesday', 'wednesday', 'thursday',
+                'friday', 'saturday', 'sunday']
+
 def load_sample_data():
     """Load sample data from .idea folder"""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -44,101 +65,148 @@ def load_sample_data():
     # Load news dataset
     news_file = os.path.join(idea_folder, 'News_Category_Dataset_v3.json')
     if os.path.exists(news_file):
-        with open(news_file, 'r', encoding='utf-8') as f:
+        # orjson's C parser takes the raw bytes per NDJSON line; no
+        # decode/strip pass needed, it tolerates the trailing newline
+        with open(news_file, 'rb') as f:
             sample_data['news_articles'] = []
             for line in f:
                 try:
-                    article = json.loads(line.strip())
+                    article = orjson.loads(line)
                     sample_data['news_articles'].append(article)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
     
-    # Load articles CSV
-    articles_file = os.path.join(idea_folder, 'Articles.csv')
-    if os.path.exists(articles_file):
-        sample_data['articles_csv'] = []
-        with open(articles_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sample_data['articles_csv'].append(row)
-    
-    # Load user data
-    users_file = os.path.join(idea_folder, 'cached_users_1000.csv')
-    if os.path.exists(users_file):
-        sample_data['users_csv'] = []
-        with open(users_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sample_data['users_csv'].append(row)
-    
-    # Load interactions data  
-    interactions_file = os.path.join(idea_folder, 'cached_interactions_1000.csv')
-    if os.path.exists(interactions_file):
-        sample_data['interactions_csv'] = []
-        with open(interactions_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                sample_data['interactions_csv'].append(row)
+    # Load the cached CSVs through pandas' C tokenizer instead of
+    # csv.DictReader's per-row dict allocation
+    csv_sources = {
+        'articles_csv': 'Articles.csv',
+        'users_csv': 'cached_users_1000.csv',
+        'interactions_csv': 'cached_interactions_1000.csv'
+    }
+    for key, csv_name in csv_sources.items():
+        csv_file = os.path.join(idea_folder, csv_name)
+        if os.path.exists(csv_file):
+            sample_data[key] = pd.read_csv(csv_file).to_dict('records')
     
     return sample_data
 
 def generate_password_hash(password: str) -> str:
-    """Generate a simple hash for demo purposes"""
+    """Generate a simple hash for demo purposes.
+
+    hashlib.sha256 dispatches to OpenSSL, which uses the SHA-NI
+    instructions where the CPU has them. If distinct per-user passwords
+    are ever hashed in bulk, reuse one sha256() object via .copy()
+    instead of constructing a fresh one per call.
+    """
     return hashlib.sha256(password.encode()).hexdigest()
 
+# Every demo user shares the same password, so hash it exactly once
+_DEMO_PASSWORD_HASH = generate_password_hash('demo123')
+
+def _uuid_batch(count: int) -> List[str]:
+    """Generate `count` v4 UUID strings from a single urandom read.
+
+    uuid.uuid4() pays an os.urandom syscall per id; one bulk read plus
+    the version/variant bit patch produces identical v4 values.
+    """
+    blob = bytearray(os.urandom(16 * count))
+    ids = []
+    for i in range(0, 16 * count, 16):
+        blob[i + 6] = (blob[i + 6] & 0x0F) | 0x40
+        blob[i + 8] = (blob[i + 8] & 0x3F) | 0x80
+        ids.append(str(uuid.UUID(bytes=bytes(blob[i:i + 16]))))
+    return ids
+
+def _timestamp_batch(rng, start: datetime, end: datetime, count: int) -> List[datetime]:
+    """Draw `count` datetimes uniformly between two datetimes.
+
+    fake.date_time_between re-parses its range spec and dispatches through
+    the provider on every call; one integer draw over the epoch range
+    replaces all of that per batch.
+    """
+    ts = rng.integers(int(start.timestamp()), int(end.timestamp()), count)
+    return [datetime.fromtimestamp(t) for t in ts]
+
 def generate_users(num_users: int = 1000) -> List[Dict[str, Any]]:
     """Generate demo users with diverse profiles"""
     users = []
-    
+
+    # Batch-generate every Faker-backed text field up front and index per
+    # row, rather than paying ~10 provider dispatches inside the loop.
+    # Usernames and URLs are drawn with headroom since each user needs
+    # several
+    usernames = [_fk().user_name() for _ in range(num_users * 3)]
+    emails = [_fk().email() for _ in range(num_users)]
+    first_names = [_fk().first_name() for _ in range(num_users)]
+    last_names = [_fk().last_name() for _ in range(num_users)]
+    bios = [_fk().text(max_nb_chars=200) for _ in range(num_users)]
+    cities = [_fk().city() for _ in range(num_users)]
+    urls = [_fk().url() for _ in range(num_users * 2)]
+    hex_digests = [_fk().sha256() for _ in range(num_users)]
+
+    # Draw every scalar random field for the whole batch in one numpy call
+    # per field; .tolist() converts to native Python types so the records
+    # stay JSON-serializable
+    rng = np.random.default_rng()
+    user_ids = _uuid_batch(num_users)
+    # Role distribution: 70% readers, 20% authors, 8% admin, 2% auditor
+    role_lookup = np.array(['reader', 'author', 'administrator', 'auditor'])
+    role_draws = role_lookup[
+        np.searchsorted([0.70, 0.90, 0.98], rng.random(num_users), side='right')
+    ].tolist()
+    anon_draws = (rng.random(num_users) < 0.15).tolist()
+    active_draws = (rng.random(num_users) > 0.05).tolist()
+    verified_draws = (rng.random(num_users) > 0.3).tolist()
+    reputation_draws = np.round(rng.uniform(0, 100, num_users), 2).tolist()
+    suffix_draws = rng.integers(1, 10000, num_users).tolist()
+    reading_time_draws = rng.integers(2, 16, num_users).tolist()
+    freshness_draws = np.round(rng.uniform(0.3, 1.0, num_users), 2).tolist()
+    diversity_draws = np.round(rng.uniform(0.2, 0.8, num_users), 2).tolist()
+    personalization_draws = np.round(rng.uniform(0.5, 1.0, num_users), 2).tolist()
+    now = datetime.now()
+    created_draws = _timestamp_batch(rng, now - timedelta(days=730), now, num_users)
+    updated_draws = _timestamp_batch(rng, now - timedelta(days=30), now, num_users)
+    last_active_draws = _timestamp_batch(rng, now - timedelta(days=7), now, num_users)
+
     for i in range(num_users):
-        # Determine role distribution: 70% readers, 20% authors, 8% admin, 2% auditor
-        role_rand = random.random()
-        if role_rand < 0.70:
-            role = 'reader'
-        elif role_rand < 0.90:
-            role = 'author'
-        elif role_rand < 0.98:
-            role = 'administrator'
-        else:
-            role = 'auditor'
-        
+        role = role_draws[i]
+
         # Some users prefer anonymous mode
-        anonymous_mode = random.random() < 0.15
+        anonymous_mode = anon_draws[i]
         
         user = {
-            'id': str(uuid.uuid4()),
-            'username': fake.user_name() + str(random.randint(1, 9999)),
-            'email': fake.email(),
-            'password_hash': generate_password_hash('demo123'),
+            'id': user_ids[i],
+            'username': usernames[i * 3] + str(suffix_draws[i]),
+            'email': emails[i],
+            'password_hash': _DEMO_PASSWORD_HASH,
             'role': role,
-            'did_address': f"did:eth:0x{fake.sha256()[:40]}" if anonymous_mode else None,
+            'did_address': f"did:eth:0x{hex_digests[i][:40]}" if anonymous_mode else None,
             'anonymous_mode': anonymous_mode,
-            'created_at': fake.date_time_between(start_date='-2y', end_date='now'),
-            'updated_at': fake.date_time_between(start_date='-30d', end_date='now'),
-            'last_active': fake.date_time_between(start_date='-7d', end_date='now'),
-            'is_active': random.random() > 0.05,  # 95% active users
-            'verification_status': random.random() > 0.3,  # 70% verified
-            'reputation_score': round(random.uniform(0, 100), 2),
+            'created_at': created_draws[i],
+            'updated_at': updated_draws[i],
+            'last_active': last_active_draws[i],
+            'is_active': active_draws[i],  # 95% active users
+            'verification_status': verified_draws[i],  # 70% verified
+            'reputation_score': reputation_draws[i],
             'profile_data': {
-                'first_name': fake.first_name(),
-                'last_name': fake.last_name(),
-                'bio': fake.text(max_nb_chars=200) if random.random() > 0.4 else None,
-                'avatar_url': f"https://api.dicebear.com/7.x/avataaars/svg?seed={fake.user_name()}",
-                'location': fake.city() if random.random() > 0.3 else None,
-                'website': fake.url() if random.random() > 0.7 else None,
+                'first_name': first_names[i],
+                'last_name': last_names[i],
+                'bio': bios[i] if random.random() > 0.4 else None,
+                'avatar_url': f"https://api.dicebear.com/7.x/avataaars/svg?seed={usernames[i * 3 + 1]}",
+                'location': cities[i] if random.random() > 0.3 else None,
+                'website': urls[i * 2] if random.random() > 0.7 else None,
                 'social_links': {
-                    'twitter': f"@{fake.user_name()}" if random.random() > 0.6 else None,
-                    'linkedin': fake.url() if random.random() > 0.8 else None
+                    'twitter': f"@{usernames[i * 3 + 2]}" if random.random() > 0.6 else None,
+                    'linkedin': urls[i * 2 + 1] if random.random() > 0.8 else None
                 }
             },
             'preferences': {
-                'categories': random.sample(list(NEWS_CATEGORIES.keys()), 
-                                          k=random.randint(2, 5)),
+                'categories': random.sample(_CAT_KEYS, k=random.randint(2, 5)),
                 'languages': random.sample(LANGUAGES, k=random.randint(1, 3)),
-                'reading_time_preference': random.randint(2, 15),  # minutes
-                'content_freshness_weight': round(random.uniform(0.3, 1.0), 2),
-                'diversity_preference': round(random.uniform(0.2, 0.8), 2),
-                'personalization_level': round(random.uniform(0.5, 1.0), 2),
+                'reading_time_preference': reading_time_draws[i],  # minutes
+                'content_freshness_weight': freshness_draws[i],
+                'diversity_preference': diversity_draws[i],
+                'personalization_level': personalization_draws[i],
                 'notification_settings': {
                     'email_notifications': random.random() > 0.4,
                     'push_notifications': random.random() > 0.6,
@@ -155,40 +223,64 @@ def generate_articles(users: List[Dict], num_articles: int = 5000) -> List[Dict[
     """Generate demo articles with realistic content"""
     articles = []
     authors = [u for u in users if u['role'] == 'author']
-    
+
+    # Per-article scalar draws, vectorized one field at a time
+    now = datetime.now()
+    rng = np.random.default_rng()
+    article_ids = _uuid_batch(num_articles)
+    # One weighted draw for all statuses; per-call choices() rebuilds the
+    # cumulative weights every time
+    status_draws = random.choices(['published', 'draft', 'archived'],
+                                  weights=[0.8, 0.15, 0.05], k=num_articles)
+    view_draws = rng.exponential(1000, num_articles)
+    like_rates = rng.uniform(0.02, 0.1, num_articles)
+    comment_rates = rng.uniform(0.005, 0.03, num_articles)
+    share_rates = rng.uniform(0.01, 0.05, num_articles)
+    publish_delay_draws = rng.integers(1, 49, num_articles).tolist()
+    engagement_draws = np.round(rng.uniform(0.1, 10.0, num_articles), 4).tolist()
+    quality_draws = np.round(rng.uniform(3.0, 9.5, num_articles), 2).tolist()
+    trending_draws = np.round(rng.uniform(0.0, 100.0, num_articles), 4).tolist()
+    # Drawing updated_at from the created_at epochs keeps the per-row
+    # "sometime after creation" constraint without any Faker dispatch
+    now_epoch = int(now.timestamp())
+    created_epochs = rng.integers(now_epoch - 365 * 86400, now_epoch, num_articles)
+    updated_epochs = rng.integers(created_epochs, now_epoch, num_articles)
+    created_draws = [datetime.fromtimestamp(t) for t in created_epochs]
+    updated_draws = [datetime.fromtimestamp(t) for t in updated_epochs]
+
     for i in range(num_articles):
+        fk = _fk()
         author = random.choice(authors)
-        category = random.choice(list(NEWS_CATEGORIES.keys()))
+        category = random.choice(_CAT_KEYS)
         subcategory = random.choice(NEWS_CATEGORIES[category])
         
         # Generate realistic content
-        title = fake.sentence(nb_words=random.randint(6, 12))[:-1]  # Remove period
-        content_paragraphs = [fake.paragraph(nb_sentences=random.randint(3, 7)) 
+        title = fk.sentence(nb_words=random.randint(6, 12))[:-1]  # Remove period
+        content_paragraphs = [fk.paragraph(nb_sentences=random.randint(3, 7)) 
                             for _ in range(random.randint(5, 15))]
         content = '\n\n'.join(content_paragraphs)
-        summary = fake.text(max_nb_chars=300)
-        
-        word_count = len(content.split())
+        summary = fk.text(max_nb_chars=300)
+
+        # Count words per paragraph instead of re-splitting the joined
+        # content, which allocates a throwaway list of every word
+        word_count = sum(p.count(' ') + 1 for p in content_paragraphs)
         reading_time = max(1, word_count // 200)  # ~200 words per minute
         
         # Publication status and timing
-        status = random.choices(
-            ['published', 'draft', 'archived'], 
-            weights=[0.8, 0.15, 0.05]
-        )[0]
+        status = status_draws[i]
         
-        created_at = fake.date_time_between(start_date='-1y', end_date='now')
+        created_at = created_draws[i]
         published_at = created_at + timedelta(
-            hours=random.randint(1, 48)
+            hours=publish_delay_draws[i]
         ) if status == 'published' else None
         
         # Generate engagement metrics based on article age and quality
-        days_since_published = (datetime.now() - (published_at or created_at)).days
+        days_since_published = (now - (published_at or created_at)).days
         days_since_published = max(1, days_since_published)  # Avoid division by zero
-        base_views = max(10, int(np.random.exponential(1000) / (days_since_published + 1)))
+        base_views = max(10, int(view_draws[i] / (days_since_published + 1)))
         
         article = {
-            'id': str(uuid.uuid4()),
+            'id': article_ids[i],
             'title': title,
             'content': content,
             'summary': summary,
@@ -196,43 +288,100 @@ def generate_articles(users: List[Dict], num_articles: int = 5000) -> List[Dict[
             'anonymous_author': author['anonymous_mode'],
             'category': category,
             'subcategory': subcategory,
-            'tags': random.sample(
-                [fake.word() for _ in range(20)], 
-                k=random.randint(3, 8)
-            ),
+            'tags': random.sample(_WORD_POOL, k=random.randint(3, 8)),
             'language': random.choice(author['preferences']['languages']),
             'reading_time': reading_time,
             'word_count': word_count,
             'status': status,
             'published_at': published_at,
             'created_at': created_at,
-            'updated_at': fake.date_time_between(start_date=created_at, end_date='now'),
+            'updated_at': updated_draws[i],
             'metadata': {
-                'source_url': fake.url() if random.random() > 0.7 else None,
-                'image_urls': [fake.image_url() for _ in range(random.randint(0, 3))],
-                'seo_keywords': random.sample(
-                    [fake.word() for _ in range(15)], 
-                    k=random.randint(3, 7)
-                )
+                'source_url': fk.url() if random.random() > 0.7 else None,
+                'image_urls': [fk.image_url() for _ in range(random.randint(0, 3))],
+                'seo_keywords': random.sample(_WORD_POOL, k=random.randint(3, 7))
             },
             'view_count': base_views,
-            'like_count': int(base_views * random.uniform(0.02, 0.1)),
-            'comment_count': int(base_views * random.uniform(0.005, 0.03)),
-            'share_count': int(base_views * random.uniform(0.01, 0.05)),
-            'engagement_score': round(random.uniform(0.1, 10.0), 4),
-            'quality_score': round(random.uniform(3.0, 9.5), 2),
-            'trending_score': round(random.uniform(0.0, 100.0), 4)
+            'like_count': int(base_views * like_rates[i]),
+            'comment_count': int(base_views * comment_rates[i]),
+            'share_count': int(base_views * share_rates[i]),
+            'engagement_score': engagement_draws[i],
+            'quality_score': quality_draws[i],
+            'trending_score': trending_draws[i]
         }
         articles.append(article)
     
     return articles
 
+def _seed_worker(seed: int):
+    """Give a worker process distinct, deterministic RNG streams"""
+    random.seed(seed)
+    np.random.seed(seed)
+    Faker.seed(seed)
+
+def _articles_chunk(args):
+    users, count, seed = args
+    _seed_worker(seed)
+    return generate_articles(users, count)
+
+def _sample_articles_chunk(args):
+    users, samples, count, seed = args
+    _seed_worker(seed)
+    return generate_articles_from_samples(users, samples, count)
+
+def generate_articles_parallel(users: List[Dict], sample_articles: List[Dict] = None,
+                               num_articles: int = 5000) -> List[Dict[str, Any]]:
+    """Generate articles across worker processes.
+
+    Article generation is the CPU-heavy part of the run (Faker paragraphs
+    dominate) and rows are independent, so the range splits cleanly into
+    one chunk per core. Each worker gets its own seed so chunks don't
+    repeat draws. Interactions and embeddings stay serial since they
+    stream to disk as generators.
+    """
+    workers = min(os.cpu_count() or 1, 8)
+    if workers <= 1 or num_articles < 1000:
+        if sample_articles is not None:
+            return generate_articles_from_samples(users, sample_articles, num_articles)
+        return generate_articles(users, num_articles)
+
+    counts = [num_articles // workers] * workers
+    counts[-1] += num_articles - sum(counts)
+    base_seed = random.randrange(2**31)
+
+    if sample_articles is not None:
+        # Hand each worker its own slice of the reference samples
+        jobs = []
+        offset = 0
+        for i, count in enumerate(counts):
+            jobs.append((users, sample_articles[offset:offset + count], count, base_seed + i))
+            offset += count
+        worker_fn = _sample_articles_chunk
+    else:
+        jobs = [(users, count, base_seed + i) for i, count in enumerate(counts)]
+        worker_fn = _articles_chunk
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = executor.map(worker_fn, jobs)
+    return [article for chunk in chunks for article in chunk]
+
 def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict], 
                                  num_articles: int = 3000) -> List[Dict[str, Any]]:
     """Generate articles using sample data as reference"""
     articles = []
     authors = [u for u in users if u['role'] == 'author']
-    
+    article_ids = _uuid_batch(num_articles)
+    now = datetime.now()
+    status_draws = random.choices(['published', 'draft', 'archived'],
+                                  weights=[0.85, 0.12, 0.03], k=num_articles)
+    rng = np.random.default_rng()
+    fallback_created_draws = _timestamp_batch(rng, now - timedelta(days=365), now,
+                                              num_articles)
+    # Sample-sourced rows can predate the one-year window, so updated_at
+    # is a per-row fraction of the creation→now span rather than a shared
+    # epoch draw
+    update_fracs = rng.random(num_articles)
+
     # Category mapping from sample data
     category_mapping = {
         'U.S. NEWS': 'politics',
@@ -252,6 +401,8 @@ def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict
     }
     
     for i in range(num_articles):
+        fk = _fk()
+
         # Use sample article as reference or generate new
         if i < len(sample_articles):
             sample = sample_articles[i]
@@ -264,25 +415,25 @@ def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict
             subcategory = NEWS_CATEGORIES.get(category, ['general'])[0]
             
             # Use real headline and description
-            title = sample.get('headline', fake.sentence(nb_words=random.randint(6, 12))[:-1])
-            summary = sample.get('short_description', fake.text(max_nb_chars=300))
+            title = sample.get('headline', fk.sentence(nb_words=random.randint(6, 12))[:-1])
+            summary = sample.get('short_description', fk.text(max_nb_chars=300))
             
             # Generate full content based on summary
             if summary and len(summary) > 20:
                 content_paragraphs = [summary]
                 # Add 3-8 more paragraphs
                 content_paragraphs.extend([
-                    fake.paragraph(nb_sentences=random.randint(3, 6)) 
+                    fk.paragraph(nb_sentences=random.randint(3, 6)) 
                     for _ in range(random.randint(3, 8))
                 ])
             else:
-                content_paragraphs = [fake.paragraph(nb_sentences=random.randint(3, 7)) 
+                content_paragraphs = [fk.paragraph(nb_sentences=random.randint(3, 7)) 
                                     for _ in range(random.randint(5, 12))]
             
             content = '\n\n'.join(content_paragraphs)
             
             # Parse date if available
-            created_at = datetime.now() - timedelta(days=random.randint(1, 365))
+            created_at = now - timedelta(days=random.randint(1, 365))
             if 'date' in sample and sample['date']:
                 try:
                     created_at = datetime.strptime(sample['date'], '%Y-%m-%d')
@@ -291,36 +442,33 @@ def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict
         else:
             # Generate new article when samples are exhausted
             author = random.choice(authors)
-            category = random.choice(list(NEWS_CATEGORIES.keys()))
+            category = random.choice(_CAT_KEYS)
             subcategory = random.choice(NEWS_CATEGORIES[category])
             
-            title = fake.sentence(nb_words=random.randint(6, 12))[:-1]
-            summary = fake.text(max_nb_chars=300)
-            content_paragraphs = [fake.paragraph(nb_sentences=random.randint(3, 7)) 
+            title = fk.sentence(nb_words=random.randint(6, 12))[:-1]
+            summary = fk.text(max_nb_chars=300)
+            content_paragraphs = [fk.paragraph(nb_sentences=random.randint(3, 7)) 
                                 for _ in range(random.randint(5, 15))]
             content = '\n\n'.join(content_paragraphs)
-            created_at = fake.date_time_between(start_date='-1y', end_date='now')
+            created_at = fallback_created_draws[i]
         
-        word_count = len(content.split())
+        word_count = sum(p.count(' ') + 1 for p in content_paragraphs)
         reading_time = max(1, word_count // 200)
         
         # Publication status and timing
-        status = random.choices(
-            ['published', 'draft', 'archived'], 
-            weights=[0.85, 0.12, 0.03]
-        )[0]
+        status = status_draws[i]
         
         published_at = created_at + timedelta(
             hours=random.randint(1, 48)
         ) if status == 'published' else None
         
         # Generate engagement metrics based on article quality and age
-        days_since_published = (datetime.now() - (published_at or created_at)).days
+        days_since_published = (now - (published_at or created_at)).days
         days_since_published = max(1, days_since_published)
         base_views = max(50, int(np.random.exponential(2000) / (days_since_published + 1)))
         
         article = {
-            'id': str(uuid.uuid4()),
+            'id': article_ids[i],
             'title': title[:500],  # Ensure title fits in database
             'content': content,
             'summary': summary,
@@ -328,24 +476,18 @@ def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict
             'anonymous_author': author['anonymous_mode'],
             'category': category,
             'subcategory': subcategory,
-            'tags': random.sample(
-                [fake.word() for _ in range(20)], 
-                k=random.randint(3, 8)
-            ),
+            'tags': random.sample(_WORD_POOL, k=random.randint(3, 8)),
             'language': random.choice(author['preferences']['languages']),
             'reading_time': reading_time,
             'word_count': word_count,
             'status': status,
             'published_at': published_at,
             'created_at': created_at,
-            'updated_at': fake.date_time_between(start_date=created_at, end_date='now'),
+            'updated_at': created_at + (now - created_at) * update_fracs[i],
             'metadata': {
-                'source_url': sample.get('link') if i < len(sample_articles) else (fake.url() if random.random() > 0.7 else None),
-                'image_urls': [fake.image_url() for _ in range(random.randint(0, 2))],
-                'seo_keywords': random.sample(
-                    [fake.word() for _ in range(15)], 
-                    k=random.randint(3, 7)
-                )
+                'source_url': sample.get('link') if i < len(sample_articles) else (fk.url() if random.random() > 0.7 else None),
+                'image_urls': [fk.image_url() for _ in range(random.randint(0, 2))],
+                'seo_keywords': random.sample(_WORD_POOL, k=random.randint(3, 7))
             },
             'view_count': base_views,
             'like_count': int(base_views * random.uniform(0.02, 0.08)),
@@ -361,139 +503,174 @@ def generate_articles_from_samples(users: List[Dict], sample_articles: List[Dict
     return articles
 
 def generate_user_interactions(users: List[Dict], articles: List[Dict], 
-                             num_interactions: int = 50000) -> List[Dict[str, Any]]:
-    """Generate realistic user-article interactions for ML training"""
-    interactions = []
-    
+                             num_interactions: int = 50000):
+    """Yield realistic user-article interactions for ML training.
+
+    Generating lazily lets main stream each record straight to disk
+    instead of holding the biggest dataset in memory as a list.
+    """
     # Filter active users and published articles
     active_users = [u for u in users if u['is_active']]
     published_articles = [a for a in articles if a['status'] == 'published']
-    
+
+    # One rng.integers call per categorical field instead of 50k
+    # random.choice calls each; the loop just indexes
+    rng = np.random.default_rng()
+    interaction_ids = _uuid_batch(num_interactions)
+    session_ids = _uuid_batch(num_interactions)
+    user_idx = rng.integers(0, len(active_users), num_interactions)
+    article_idx = rng.integers(0, len(published_articles), num_interactions)
+    type_idx = rng.integers(0, len(INTERACTION_TYPES), num_interactions)
+    device_idx = rng.integers(0, len(DEVICE_TYPES), num_interactions)
+    referrer_idx = rng.integers(0, len(REFERRERS), num_interactions)
+    tod_idx = rng.integers(0, len(TIMES_OF_DAY), num_interactions)
+    dow_idx = rng.integers(0, len(DAYS_OF_WEEK), num_interactions)
+
+    # Strength and reading-progress bounds per interaction type, in
+    # INTERACTION_TYPES order (like, dislike, save, share, view, comment).
+    # Indexing the bound tables by type_idx and drawing one uniform array
+    # replaces six throwaway random.uniform calls per row plus the
+    # per-type branching
+    strength_low = np.array([0.7, 0.8, 0.8, 0.9, 0.1, 0.9])[type_idx]
+    strength_high = np.array([1.0, 1.0, 1.0, 1.0, 0.3, 1.0])[type_idx]
+    strength_draws = np.round(rng.uniform(strength_low, strength_high), 2).tolist()
+
+    progress_low = np.array([0.6, 0.3, 0.6, 0.3, 0.1, 0.6])[type_idx]
+    progress_high = np.array([1.0, 0.9, 1.0, 0.9, 1.0, 1.0])[type_idx]
+    progress = rng.uniform(progress_low, progress_high)
+    progress_draws = np.round(progress, 2).tolist()
+
+    reading_times = np.array([a['reading_time'] for a in published_articles])[article_idx]
+    time_spent_draws = (reading_times * 60 * progress
+                        * rng.uniform(0.5, 1.5, num_interactions)).astype(int).tolist()
+
+    # Preference-bias filter as one boolean expression: a (users x
+    # categories) membership matrix indexed by the draw arrays replaces
+    # building a set and testing `in` on every row
+    cat2i = {c: i for i, c in enumerate(_CAT_KEYS)}
+    user_cat_mask = np.zeros((len(active_users), len(_CAT_KEYS)), dtype=bool)
+    for ui, user in enumerate(active_users):
+        for cat in user['preferences']['categories']:
+            user_cat_mask[ui, cat2i[cat]] = True
+    article_cat_idx = np.array([cat2i[a['category']] for a in published_articles])
+    preferred = user_cat_mask[user_idx, article_cat_idx[article_idx]]
+    skipped = preferred & (rng.random(num_interactions) < 0.3)
+
+    # Per-row lower bound is "article visible and user existed"; with the
+    # entity epochs gathered through the index arrays the timestamp draw
+    # is one uniform call instead of 50k Faker range computations
+    now_epoch = datetime.now().timestamp()
+    user_epochs = np.array([u['created_at'].timestamp() for u in active_users])[user_idx]
+    article_epochs = np.array([
+        (a['published_at'] or a['created_at']).timestamp() for a in published_articles
+    ])[article_idx]
+    created_epochs = rng.uniform(np.maximum(user_epochs, article_epochs), now_epoch)
+
     for i in range(num_interactions):
-        user = random.choice(active_users)
-        article = random.choice(published_articles)
-        
         # User preference-based article selection bias
-        user_categories = set(user['preferences']['categories'])
-        if article['category'] in user_categories:
-            # Higher interaction probability for preferred categories
-            if random.random() < 0.3:  # Skip some non-preferred content
-                continue
-        
-        interaction_type = random.choice(INTERACTION_TYPES)
-        
-        # Interaction strength based on type and user preferences
-        strength_mapping = {
-            'view': random.uniform(0.1, 0.3),
-            'like': random.uniform(0.7, 1.0),
-            'dislike': random.uniform(0.8, 1.0),
-            'save': random.uniform(0.8, 1.0),
-            'share': random.uniform(0.9, 1.0),
-            'comment': random.uniform(0.9, 1.0)
-        }
-        
-        interaction_strength = strength_mapping[interaction_type]
-        
-        # Reading progress based on interaction type
-        if interaction_type == 'view':
-            reading_progress = random.uniform(0.1, 1.0)
-        elif interaction_type in ['like', 'save', 'comment']:
-            reading_progress = random.uniform(0.6, 1.0)
-        else:
-            reading_progress = random.uniform(0.3, 0.9)
-        
-        time_spent = int(article['reading_time'] * 60 * reading_progress * random.uniform(0.5, 1.5))
+        if skipped[i]:
+            continue
+
+        user = active_users[user_idx[i]]
+        article = published_articles[article_idx[i]]
+        interaction_type = INTERACTION_TYPES[type_idx[i]]
         
         interaction = {
-            'id': str(uuid.uuid4()),
+            'id': interaction_ids[i],
             'user_id': user['id'],
             'article_id': article['id'],
             'interaction_type': interaction_type,
-            'interaction_strength': round(interaction_strength, 2),
-            'reading_progress': round(reading_progress, 2),
-            'time_spent': time_spent,
-            'created_at': fake.date_time_between(
-                start_date=max(article['published_at'] or article['created_at'], 
-                             user['created_at']),
-                end_date='now'
-            ),
-            'session_id': str(uuid.uuid4()),
-            'device_type': random.choice(['desktop', 'mobile', 'tablet']),
+            'interaction_strength': strength_draws[i],
+            'reading_progress': progress_draws[i],
+            'time_spent': time_spent_draws[i],
+            'created_at': datetime.fromtimestamp(created_epochs[i]),
+            'session_id': session_ids[i],
+            'device_type': DEVICE_TYPES[device_idx[i]],
             'context_data': {
-                'referrer': random.choice([None, 'google', 'twitter', 'facebook', 'direct']),
+                'referrer': REFERRERS[referrer_idx[i]],
                 'scroll_depth': round(random.uniform(0.3, 1.0), 2),
                 'clicks_count': random.randint(0, 5),
-                'time_of_day': random.choice(['morning', 'afternoon', 'evening', 'night']),
-                'day_of_week': random.choice(['monday', 'tuesday', 'wednesday', 'thursday', 
-                                           'friday', 'saturday', 'sunday'])
+                'time_of_day': TIMES_OF_DAY[tod_idx[i]],
+                'day_of_week': DAYS_OF_WEEK[dow_idx[i]]
             }
         }
-        interactions.append(interaction)
-    
-    return interactions
+        yield interaction
 
-def generate_ml_embeddings(users: List[Dict], articles: List[Dict]) -> List[Dict[str, Any]]:
-    """Generate sample ML embeddings for demonstration"""
-    embeddings = []
-    
+def generate_ml_embeddings(users: List[Dict], articles: List[Dict]):
+    """Yield sample ML embeddings for demonstration"""
     models = ['two_tower', 'cnn', 'rnn', 'gnn', 'attention']
     embedding_dims = {'two_tower': 128, 'cnn': 256, 'rnn': 200, 'gnn': 150, 'attention': 300}
-    
-    # Generate user embeddings
-    for user in users[:500]:  # Limit for demo
-        for model in models:
-            if random.random() > 0.3:  # Not all users have all model embeddings
-                continue
-                
-            dim = embedding_dims[model]
-            embedding = np.random.normal(0, 0.1, dim).tolist()
-            
-            embeddings.append({
-                'id': str(uuid.uuid4()),
-                'entity_id': user['id'],
-                'entity_type': 'user',
-                'model_type': model,
-                'embedding_vector': embedding,
-                'embedding_dimension': dim,
-                'model_version': f"{model}_v1.2",
-                'created_at': fake.date_time_between(start_date='-30d', end_date='now'),
-                'updated_at': fake.date_time_between(start_date='-7d', end_date='now'),
-                'is_active': True
-            })
-    
-    # Generate article embeddings
-    for article in articles[:2000]:  # Limit for demo
+
+    rng = np.random.default_rng()
+    now = datetime.now()
+    target_users = users[:500]  # Limit for demo
+    target_articles = articles[:2000]  # Limit for demo
+
+    # Upper bound on ids needed; the random skips below consume fewer
+    id_iter = iter(_uuid_batch((len(target_users) + len(target_articles)) * len(models)))
+
+    # Only some entities carry each model's embedding
+    for entity_type, entities, keep_prob in (('user', target_users, 0.3),
+                                             ('article', target_articles, 0.2)):
         for model in models:
-            if random.random() > 0.2:  # Most articles should have embeddings
-                continue
-                
             dim = embedding_dims[model]
-            embedding = np.random.normal(0, 0.1, dim).tolist()
-            
-            embeddings.append({
-                'id': str(uuid.uuid4()),
-                'entity_id': article['id'],
-                'entity_type': 'article',
-                'model_type': model,
-                'embedding_vector': embedding,
-                'embedding_dimension': dim,
-                'model_version': f"{model}_v1.2",
-                'created_at': fake.date_time_between(start_date='-30d', end_date='now'),
-                'updated_at': fake.date_time_between(start_date='-7d', end_date='now'),
-                'is_active': True
-            })
-    
-    return embeddings
+            mask = rng.random(len(entities)) <= keep_prob
+            selected = [e for e, keep in zip(entities, mask) if keep]
+
+            # One (n, dim) draw per model instead of n small per-row calls;
+            # float32 matches real model output and halves the intermediate
+            vectors = rng.normal(0, 0.1, (len(selected), dim)).astype(np.float32)
+            created_draws = _timestamp_batch(rng, now - timedelta(days=30), now,
+                                             len(selected))
+            updated_draws = _timestamp_batch(rng, now - timedelta(days=7), now,
+                                             len(selected))
+
+            for j, (entity, vector) in enumerate(zip(selected, vectors)):
+                yield {
+                    'id': next(id_iter),
+                    'entity_id': entity['id'],
+                    'entity_type': entity_type,
+                    'model_type': model,
+                    # Keep the float32 row view; orjson's OPT_SERIALIZE_NUMPY
+                    # writes it directly, skipping ~dim boxed PyFloats per row
+                    'embedding_vector': vector,
+                    'embedding_dimension': dim,
+                    'model_version': f"{model}_v1.2",
+                    'created_at': created_draws[j],
+                    'updated_at': updated_draws[j],
+                    'is_active': True
+                }
 
 def save_to_json(data: List[Dict], filename: str):
-    """Save data to JSON file with proper datetime serialization"""
-    def json_serializer(obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=json_serializer)
+    """Save data to a JSON file.
+
+    orjson serializes datetimes natively (ISO format, matching the old
+    custom serializer) and writes one bytes blob, skipping the stdlib
+    encoder's per-fragment string buffering entirely.
+    """
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
+
+def save_stream_to_json(rows, filename: str) -> int:
+    """Stream an iterable of records to a JSON array file.
+
+    One record is serialized at a time, so the dataset never exists as a
+    full Python list; the output is still a plain JSON array for the DB
+    seeders' streaming readers. Returns the number of records written.
+    """
+    count = 0
+    with open(filename, 'wb') as f:
+        f.write(b'[')
+        separator = b'\n'
+        for row in rows:
+            f.write(separator)
+            f.write(orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY))
+            separator = b',\n'
+            count += 1
+        f.write(b'\n]')
+    return count
 
 def main():
     """Generate all demo data"""
@@ -518,29 +695,34 @@ def main():
     # Use sample articles if available, otherwise generate
     if sample_data.get('news_articles'):
         print("Using sample news articles as reference...")
-        articles = generate_articles_from_samples(users, sample_data['news_articles'], 3000)
+        articles = generate_articles_parallel(users, sample_data['news_articles'], 3000)
     else:
-        articles = generate_articles(users, 5000)
-    
-    print("Generating user interactions...")
-    interactions = generate_user_interactions(users, articles, 50000)
-    
-    print("Generating ML embeddings...")
-    embeddings = generate_ml_embeddings(users, articles)
+        articles = generate_articles_parallel(users, num_articles=5000)
     
-    # Save to files
-    print("Saving data to files...")
+    # Users and articles stay in memory (interactions need both); the two
+    # biggest datasets stream straight to disk as they are generated
+    print("Saving users and articles...")
     save_to_json(users, 'demo_users.json')
     save_to_json(articles, 'demo_articles.json')
-    save_to_json(interactions, 'demo_interactions.json')
-    save_to_json(embeddings, 'demo_embeddings.json')
+
+    print("Generating user interactions...")
+    num_interactions = save_stream_to_json(
+        generate_user_interactions(users, articles, 50000),
+        'demo_interactions.json'
+    )
+
+    print("Generating ML embeddings...")
+    num_embeddings = save_stream_to_json(
+        generate_ml_embeddings(users, articles),
+        'demo_embeddings.json'
+    )
     
     print(f"""
 Demo data generated successfully!
 - Users: {len(users)}
 - Articles: {len(articles)}
-- Interactions: {len(interactions)}
-- ML Embeddings: {len(embeddings)}
+- Interactions: {num_interactions}
+- ML Embeddings: {num_embeddings}
     
 Files saved:
 - demo_users.json